@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Author, Genre, Book, BookInstance, Language
+from .models import ArchivedBookInstance, Author, Genre, Book, BookInstance, Language
 
 
 class BookInline(admin.TabularInline):
@@ -39,6 +39,16 @@ class BookInstanceAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(ArchivedBookInstance)
+class ArchivedBookInstanceAdmin(admin.ModelAdmin):
+    list_display = ('book', 'status', 'imprint', 'archived_at', 'id')
+    list_filter = ('status',)
+    readonly_fields = ('id', 'book', 'imprint', 'due_back', 'borrower', 'status', 'archived_at')
+
+    def has_add_permission(self, request):
+        return False
+
+
 admin.site.register(Author, AuthorAdmin)
 admin.site.register(Genre)
 admin.site.register(Language)
@@ -0,0 +1,239 @@
+import base64
+import binascii
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.http import JsonResponse
+from django.views import View
+
+from .models import Author, Book, BookInstance, Genre, Language
+
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+AUTOCOMPLETE_LIMIT = 20
+
+
+class ApiError(Exception):
+    pass
+
+
+def encode_cursor(pk):
+    return base64.urlsafe_b64encode(str(pk).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        return base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ApiError('Invalid cursor')
+
+
+class ApiListView(View):
+    """
+    Read-only JSON listing of a model, serialized from ``values()`` rows.
+
+    ``fields`` maps the public field name to the column it is read from.
+    Many-to-many fields are listed in ``m2m_fields`` and loaded with one extra
+    query against the through table. Supports ``?fields=``, ``?ids=`` and
+    keyset pagination over the primary key with ``?cursor=``/``?limit=``.
+    """
+    model = None
+    fields = {}
+    m2m_fields = ()
+
+    def get_queryset(self):
+        return self.model._default_manager.all()
+
+    def get(self, request, *args, **kwargs):
+        try:
+            fields = self.get_fields()
+            queryset = self.get_queryset().order_by('pk')
+            if 'ids' in request.GET:
+                rows = list(self.get_values(queryset.filter(pk__in=self.get_ids()), fields))
+                next_cursor = None
+            else:
+                rows, next_cursor = self.paginate(queryset, fields)
+        except ApiError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+        self.add_m2m(rows, fields)
+        return JsonResponse({'results': rows, 'next': next_cursor})
+
+    def get_fields(self):
+        available = list(self.fields) + list(self.m2m_fields)
+        raw = self.request.GET.get('fields')
+        if not raw:
+            return available
+        names = [name.strip() for name in raw.split(',') if name.strip()]
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ApiError('Unknown field(s): {0}'.format(', '.join(unknown)))
+        if 'id' not in names:
+            names.insert(0, 'id')
+        return names
+
+    def get_ids(self):
+        ids = [pk.strip() for pk in self.request.GET['ids'].split(',') if pk.strip()]
+        if not ids:
+            raise ApiError('No ids given')
+        if len(ids) > MAX_LIMIT:
+            raise ApiError('At most {0} ids can be fetched at once'.format(MAX_LIMIT))
+        return [self.to_pk(pk, 'Invalid id') for pk in ids]
+
+    def to_pk(self, value, error):
+        pk_field = self.model._meta.pk
+        try:
+            pk = pk_field.to_python(value)
+        except ValidationError:
+            raise ApiError(error)
+        if isinstance(pk, int):
+            # Out-of-range integers make the database driver raise OverflowError.
+            # SQLite reports no range; its integers are signed 64-bit.
+            low, high = connection.ops.integer_field_range(pk_field.get_internal_type())
+            if not (-2 ** 63 if low is None else low) <= pk <= (2 ** 63 - 1 if high is None else high):
+                raise ApiError(error)
+        return pk
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.GET.get('limit', DEFAULT_LIMIT))
+        except ValueError:
+            raise ApiError('Invalid limit')
+        return max(1, min(limit, MAX_LIMIT))
+
+    def paginate(self, queryset, fields):
+        limit = self.get_limit()
+        cursor = self.request.GET.get('cursor')
+        if cursor:
+            queryset = queryset.filter(pk__gt=self.to_pk(decode_cursor(cursor), 'Invalid cursor'))
+
+        rows = list(self.get_values(queryset[:limit + 1], fields))
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, encode_cursor(rows[-1]['id'])
+        return rows, None
+
+    def get_values(self, queryset, fields):
+        columns = [(name, self.fields[name]) for name in fields if name in self.fields]
+        for row in queryset.values(*[column for name, column in columns]):
+            yield {name: row[column] for name, column in columns}
+
+    def add_m2m(self, rows, fields):
+        if not rows:
+            return
+        ids = [row['id'] for row in rows]
+        for name in self.m2m_fields:
+            if name not in fields:
+                continue
+            field = self.model._meta.get_field(name)
+            source = field.m2m_field_name() + '_id'
+            target = field.m2m_reverse_field_name() + '_id'
+            related = {pk: [] for pk in ids}
+            links = field.remote_field.through.objects.filter(**{source + '__in': ids})
+            for pk, related_pk in links.order_by(target).values_list(source, target):
+                related[pk].append(related_pk)
+            for row in rows:
+                row[name] = related[row['id']]
+
+
+class BookApiView(ApiListView):
+    model = Book
+    fields = {
+        'id': 'id',
+        'title': 'title',
+        'author': 'author_id',
+        'summary': 'summary',
+        'isbn': 'isbn',
+        'language': 'language_id',
+    }
+    m2m_fields = ('genre',)
+
+
+class AuthorApiView(ApiListView):
+    model = Author
+    fields = {
+        'id': 'id',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'date_of_birth': 'date_of_birth',
+        'date_of_death': 'date_of_death',
+    }
+
+
+class BookInstanceApiView(ApiListView):
+    model = BookInstance
+    fields = {
+        'id': 'id',
+        'book': 'book_id',
+        'imprint': 'imprint',
+        'status': 'status',
+        'due_back': 'due_back',
+    }
+
+
+class LoanedApiView(BookInstanceApiView):
+
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return JsonResponse({'error': 'Authentication required'}, status=401)
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_queryset(self):
+        return BookInstance.objects.filter(borrower=self.request.user).filter(status__exact='o')
+
+
+class AutocompleteView(View):
+    """
+    Prefix search returning ``{'results': [{'id': ..., 'text': ...}]}``.
+
+    Uses ``istartswith`` so the case-insensitive prefix indexes created in
+    the migrations can serve the lookup.
+    """
+    model = None
+    search_field = 'name'
+
+    def get_queryset(self, term):
+        return self.model._default_manager.filter(**{self.search_field + '__istartswith': term})
+
+    def get_label(self, row):
+        return row[self.search_field]
+
+    def get(self, request, *args, **kwargs):
+        term = request.GET.get('q', '').strip()
+        if not term:
+            return JsonResponse({'results': []})
+        queryset = self.get_queryset(term).order_by(self.search_field, 'pk')
+        rows = queryset.values('pk', *self.get_columns())[:AUTOCOMPLETE_LIMIT]
+        return JsonResponse({'results': [{'id': row['pk'], 'text': self.get_label(row)} for row in rows]})
+
+    def get_columns(self):
+        return [self.search_field]
+
+
+class AuthorAutocompleteView(AutocompleteView):
+    model = Author
+    search_field = 'last_name'
+
+    def get_queryset(self, term):
+        # "Smith, J" narrows on the first name as well.
+        last_name, comma, first_name = term.partition(',')
+        queryset = super().get_queryset(last_name.strip())
+        if first_name.strip():
+            queryset = queryset.filter(first_name__istartswith=first_name.strip())
+        return queryset
+
+    def get_columns(self):
+        return ['last_name', 'first_name']
+
+    def get_label(self, row):
+        return '{0}, {1}'.format(row['last_name'], row['first_name'])
+
+
+class GenreAutocompleteView(AutocompleteView):
+    model = Genre
+
+
+class LanguageAutocompleteView(AutocompleteView):
+    model = Language
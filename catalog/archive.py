@@ -0,0 +1,76 @@
+"""
+Move cold rows out of the tables that the catalog pages scan.
+
+Each batch is copied with a single INSERT ... SELECT and removed with a single
+DELETE inside one transaction, so a batch is either fully archived or left in
+place. Batches are bounded and optionally spaced out to limit lock time and
+replication lag on a live database.
+"""
+
+import time
+
+from django.contrib.sessions.models import Session
+from django.db import connection, transaction
+from django.db.models import DateTimeField, Value
+from django.utils import timezone
+
+from .models import ArchivedBookInstance, BookInstance
+
+
+ARCHIVE_BATCH_SIZE = 1000
+ARCHIVE_STATUSES = ('w',)
+ARCHIVED_COLUMNS = ['id', 'book_id', 'imprint', 'due_back', 'borrower_id', 'status']
+
+
+def archive_batch(ids, statuses=ARCHIVE_STATUSES):
+    """
+    Archive the copies among ``ids`` that still have one of ``statuses``.
+
+    The ids were picked outside this transaction, so the rows are locked and
+    re-filtered by status here: a copy checked out in the meantime stays put.
+    """
+    columns = ', '.join(connection.ops.quote_name(column) for column in ARCHIVED_COLUMNS + ['archived_at'])
+
+    with transaction.atomic():
+        copies = BookInstance.objects.filter(pk__in=ids, status__in=statuses).order_by()
+        ids = list(copies.select_for_update().values_list('pk', flat=True))
+        if not ids:
+            return 0
+        select = (copies.filter(pk__in=ids)
+                  .annotate(archived=Value(timezone.now(), output_field=DateTimeField()))
+                  .values_list(*ARCHIVED_COLUMNS, 'archived'))
+        sql, params = select.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('INSERT INTO {0} ({1}) {2}'.format(
+                connection.ops.quote_name(ArchivedBookInstance._meta.db_table), columns, sql), params)
+        copies.filter(pk__in=ids).delete()
+    return len(ids)
+
+
+def archive_copies(statuses=ARCHIVE_STATUSES, batch_size=ARCHIVE_BATCH_SIZE, sleep=0, progress=None):
+    total = 0
+    while True:
+        ids = list(BookInstance.objects.filter(status__in=statuses).order_by()
+                   .values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return total
+        total += archive_batch(ids, statuses)
+        if progress is not None:
+            progress(total)
+        if sleep:
+            time.sleep(sleep)
+
+
+def purge_expired_sessions(batch_size=ARCHIVE_BATCH_SIZE, sleep=0, progress=None):
+    now = timezone.now()
+    total = 0
+    while True:
+        keys = list(Session.objects.filter(expire_date__lt=now).values_list('pk', flat=True)[:batch_size])
+        if not keys:
+            return total
+        Session.objects.filter(pk__in=keys).delete()
+        total += len(keys)
+        if progress is not None:
+            progress(total)
+        if sleep:
+            time.sleep(sleep)
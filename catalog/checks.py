@@ -0,0 +1,81 @@
+import os
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.checks import Error, Tags, register
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+
+from . import assets
+
+
+# href/src of tags that load a page asset; plain links (<a href>) are not assets.
+ASSET_REF = re.compile(r'<(?:link|script|img|source)\b[^>]*?\b(?:href|src)\s*=\s*(["\'])(.*?)\1', re.IGNORECASE)
+STATIC_TAG = re.compile(r'^\{%\s*static\s+["\']([^"\']+)["\']\s*%\}$')
+EXTERNAL = re.compile(r'^(?:[a-z][a-z0-9+.-]*:)?//', re.IGNORECASE)
+
+
+def template_files():
+    """Yield the project's own templates; those shipped by installed packages are not ours to fix."""
+    base_dir = os.path.join(os.path.abspath(settings.BASE_DIR), '')
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        for directory in engine.template_dirs:
+            if not os.path.join(os.path.abspath(directory), '').startswith(base_dir):
+                continue
+            for root, dirs, files in os.walk(directory):
+                for name in files:
+                    if name.endswith('.html'):
+                        yield os.path.join(root, name)
+
+
+def check_template(path):
+    errors = []
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    for match in ASSET_REF.finditer(source):
+        url = match.group(2)
+        line = source.count('\n', 0, match.start()) + 1
+        where = '{0}:{1}'.format(path, line)
+        static = STATIC_TAG.match(url)
+        if EXTERNAL.match(url):
+            errors.append(Error(
+                'External asset {0!r} in {1}.'.format(url, where),
+                hint='Vendor the file under a static directory and reference it with {% static %}.',
+                id='catalog.E001',
+            ))
+        elif static is None:
+            errors.append(Error(
+                'Asset {0!r} in {1} does not use {{% static %}} and will not be served with a hashed name.'.format(
+                    url, where),
+                hint='Reference it as {% static "path" %} so the manifest storage can hash it.',
+                id='catalog.E002',
+            ))
+        elif finders.find(static.group(1)) is None:
+            errors.append(Error(
+                'Static file {0!r} referenced in {1} does not exist.'.format(static.group(1), where),
+                id='catalog.E003',
+            ))
+    return errors
+
+
+@register(Tags.templates)
+def check_template_assets(app_configs, **kwargs):
+    errors = []
+    for path in template_files():
+        errors.extend(check_template(path))
+    return errors
+
+
+@register('staticfiles')
+def check_bundles(app_configs, **kwargs):
+    return [
+        Error(
+            'Bundle {0!r} is out of date with its sources.'.format(name),
+            hint='Run "python manage.py build_assets" and commit the result.',
+            id='catalog.E004',
+        )
+        for name in assets.stale_bundles()
+    ]
@@ -0,0 +1,183 @@
+"""
+Find and merge near-duplicate authors.
+
+Authors are grouped by a blocking key (folded surname, first initial, birth
+year) and only pairs inside a block are scored, so the work grows with the
+block sizes rather than with the square of the number of authors. Requires
+NumPy.
+"""
+
+import logging
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+import numpy as np
+from django.db import transaction
+
+from .models import Author, Book
+
+
+ITER_BATCH_SIZE = 5000
+DEFAULT_THRESHOLD = 0.85
+MAX_BLOCK_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+
+def fold(text):
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(c for c in decomposed if c.isalnum()).casefold()
+
+
+def blocking_key(first_name, last_name, date_of_birth):
+    return fold(last_name), fold(first_name)[:1], date_of_birth.year if date_of_birth else None
+
+
+def iter_authors(batch_size=ITER_BATCH_SIZE):
+    last = 0
+    while True:
+        rows = list(Author.objects.filter(pk__gt=last).order_by('pk')
+                    .values_list('pk', 'first_name', 'last_name', 'date_of_birth')[:batch_size])
+        if not rows:
+            return
+        yield from rows
+        last = rows[-1][0]
+
+
+def build_blocks(rows, max_block_size=MAX_BLOCK_SIZE):
+    """
+    Group rows by blocking key, dropping singletons.
+
+    Common surnames without a birth date easily put thousands of authors in
+    one block. Such blocks are split again by the full folded first name (so
+    "J." and "John" are no longer compared there), and anything still too
+    large is cut into ``max_block_size`` pieces with a warning.
+    """
+    blocks = defaultdict(list)
+    for row in rows:
+        pk, first_name, last_name, date_of_birth = row
+        blocks[blocking_key(first_name, last_name, date_of_birth)].append(row)
+
+    result = []
+    for key, block in blocks.items():
+        if len(block) <= max_block_size:
+            result.append(block)
+            continue
+        by_name = defaultdict(list)
+        for row in block:
+            by_name[fold(row[1])].append(row)
+        for name, sub_block in by_name.items():
+            if len(sub_block) > max_block_size:
+                logger.warning('Block %r (first name %r) has %d authors; comparing in pieces of %d',
+                               key, name, len(sub_block), max_block_size)
+            result.extend(sub_block[start:start + max_block_size]
+                          for start in range(0, len(sub_block), max_block_size))
+    return [block for block in result if len(block) > 1]
+
+
+def name_similarity(first_a, first_b):
+    """Similarity of two folded first names."""
+    if first_a == first_b:
+        return 1.0
+    if first_a.startswith(first_b) or first_b.startswith(first_a):
+        # "J" and "John" share the block initial; treat as a likely match.
+        return 0.9
+    return SequenceMatcher(None, first_a, first_b).ratio()
+
+
+def pair_score(first_a, first_b, born_a, born_b):
+    if born_a and born_b and born_a != born_b:
+        return 0.0
+    similarity = name_similarity(first_a, first_b)
+    if born_a and born_a == born_b:
+        similarity = min(1.0, similarity + 0.1)
+    return similarity
+
+
+def score(a, b):
+    """Similarity of two ``(pk, first_name, last_name, date_of_birth)`` rows in the same block."""
+    return pair_score(fold(a[1]), fold(b[1]), a[3], b[3])
+
+
+def candidate_pairs(folded, minimum):
+    """
+    Index pairs ``(i, j)``, ``i < j``, whose names may score at least ``minimum``.
+
+    Equal and prefix names are found through a dictionary. For the rest,
+    ``2 * shared letters / total length`` bounds ``SequenceMatcher.ratio()``
+    from above and is computed for a whole row of the block at once.
+    """
+    by_name = defaultdict(list)
+    for i, name in enumerate(folded):
+        by_name[name].append(i)
+    pairs = set()
+    for i, name in enumerate(folded):
+        for end in range(1, len(name) + 1):
+            for j in by_name.get(name[:end], ()):
+                if j != i:
+                    pairs.add((min(i, j), max(i, j)))
+
+    alphabet = {char: column for column, char in enumerate(sorted(set(''.join(folded))))}
+    counts = np.zeros((len(folded), max(len(alphabet), 1)), dtype=np.int16)
+    for i, name in enumerate(folded):
+        for char in name:
+            counts[i, alphabet[char]] += 1
+    lengths = counts.sum(axis=1)
+    for i in range(len(folded) - 1):
+        shared = np.minimum(counts[i], counts[i + 1:]).sum(axis=1)
+        total = lengths[i] + lengths[i + 1:]
+        bound = np.divide(2.0 * shared, total, out=np.zeros(len(total)), where=total > 0)
+        pairs.update((i, int(j)) for j in np.flatnonzero(bound >= minimum) + i + 1)
+    return pairs
+
+
+def find_duplicates(rows, threshold=DEFAULT_THRESHOLD, max_block_size=MAX_BLOCK_SIZE):
+    """
+    Return ``{canonical_pk: [duplicate_pk, ...]}``, keeping the oldest author of each group.
+
+    Only pairs scoring at least ``threshold`` are kept, as a sparse edge list;
+    pairs without an edge count as non-matches.
+    Clusters are only joined when every cross pair has an edge, so an initial
+    such as "J." cannot chain "John" and "Jane" together.
+    """
+    groups = {}
+    for block in build_blocks(rows, max_block_size):
+        folded = [fold(row[1]) for row in block]
+        edges = []
+        neighbours = defaultdict(set)
+        # The same birth date adds 0.1, so names down to threshold - 0.1 can still match.
+        for i, j in candidate_pairs(folded, threshold - 0.1):
+            a, b = block[i], block[j]
+            value = pair_score(folded[i], folded[j], a[3], b[3])
+            if value >= threshold:
+                edges.append((value, a[0], b[0]))
+                neighbours[a[0]].add(b[0])
+                neighbours[b[0]].add(a[0])
+
+        clusters = {}
+        for value, a, b in sorted(edges, key=lambda edge: (-edge[0], edge[1], edge[2])):
+            cluster_a, cluster_b = clusters.get(a, [a]), clusters.get(b, [b])
+            if cluster_a is cluster_b:
+                continue
+            if all(y in neighbours[x] for x in cluster_a for y in cluster_b):
+                merged = cluster_a + cluster_b
+                for pk in merged:
+                    clusters[pk] = merged
+
+        for members in {id(members): members for members in clusters.values()}.values():
+            members = sorted(members)
+            groups[members[0]] = members[1:]
+    return groups
+
+
+def merge(groups):
+    """Repoint books to the canonical author and delete the duplicates, in one transaction."""
+    books = 0
+    with transaction.atomic():
+        for canonical, duplicates in groups.items():
+            books += Book.objects.filter(author_id__in=duplicates).update(author_id=canonical)
+        duplicates = [pk for pks in groups.values() for pk in pks]
+        for start in range(0, len(duplicates), ITER_BATCH_SIZE):
+            Author.objects.filter(pk__in=duplicates[start:start + ITER_BATCH_SIZE]).delete()
+    return books
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.db import transaction
+
+from .models import ArchivedBookInstance, Author, Book, BookInstance
+
+
+DELETE_CHUNK_SIZE = 1000
+
+
+def inline_delete_limit():
+    return getattr(settings, 'CATALOG_INLINE_DELETE_LIMIT', 1000)
+
+
+def null_in_chunks(queryset, field, chunk_size=DELETE_CHUNK_SIZE, progress=None):
+    """
+    Set ``field`` to NULL on every row of ``queryset`` with one UPDATE per chunk.
+
+    Unlike Django's deletion collector this never loads the rows themselves,
+    only a chunk of primary keys at a time.
+    """
+    manager = queryset.model._default_manager
+    total = 0
+    while True:
+        ids = list(queryset.order_by().values_list('pk', flat=True)[:chunk_size])
+        if not ids:
+            return total
+        total += manager.filter(pk__in=ids).update(**{field: None})
+        if progress is not None:
+            progress(total)
+
+
+def delete_author(pk, chunk_size=DELETE_CHUNK_SIZE, progress=None):
+    books = null_in_chunks(Book.objects.filter(author_id=pk), 'author', chunk_size, progress)
+    with transaction.atomic():
+        Author.objects.filter(pk=pk).delete()
+    return books
+
+
+def delete_book(pk, chunk_size=DELETE_CHUNK_SIZE, progress=None):
+    copies = null_in_chunks(BookInstance.objects.filter(book_id=pk), 'book', chunk_size, progress)
+    null_in_chunks(ArchivedBookInstance.objects.filter(book_id=pk), 'book', chunk_size)
+    with transaction.atomic():
+        Book.genre.through.objects.filter(book_id=pk).delete()
+        Book.objects.filter(pk=pk).delete()
+    return copies
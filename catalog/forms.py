@@ -1,7 +1,9 @@
 from django import forms
 import datetime
 from django.core.exceptions import ValidationError
+from django.urls import reverse
 from django.utils.translation import ugettext_lazy as _
+from .models import Book
 
 
 class RenewBookForm(forms.Form):
@@ -17,3 +19,56 @@ class RenewBookForm(forms.Form):
             raise ValidationError(_('Invalid date - renewal more than 4 weeks ahead'))
 
         return data
+
+
+class AutocompleteMixin:
+    """
+    Render only the selected options; the rest are fetched from ``url`` as the user types.
+
+    Keeps the cost of rendering a form independent of the size of the related table.
+    """
+
+    class Media:
+        js = ('js/autocomplete.js',)
+
+    def __init__(self, url, attrs=None):
+        super().__init__(attrs)
+        self.url = url
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context['widget']['attrs']['data-autocomplete-url'] = reverse(self.url)
+        return context
+
+    def optgroups(self, name, value, attrs=None):
+        selected = [v for v in value if v not in (None, '')]
+        choices = [] if self.allow_multiple_selected else [('', '---------')]
+        if selected:
+            try:
+                choices += [self.choices.choice(obj) for obj in self.choices.queryset.filter(pk__in=selected)]
+            except (ValueError, ValidationError):
+                pass
+
+        options = [self.create_option(name, option_value, label, str(option_value) in selected, index, attrs=attrs)
+                   for index, (option_value, label) in enumerate(choices)]
+        return [(None, options, 0)]
+
+
+class AutocompleteSelect(AutocompleteMixin, forms.Select):
+    pass
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin, forms.SelectMultiple):
+    pass
+
+
+class BookForm(forms.ModelForm):
+
+    class Meta:
+        model = Book
+        fields = '__all__'
+        widgets = {
+            'author': AutocompleteSelect('autocomplete-author'),
+            'language': AutocompleteSelect('autocomplete-language'),
+            'genre': AutocompleteSelectMultiple('autocomplete-genre'),
+        }
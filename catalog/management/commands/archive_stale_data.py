@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from catalog import archive
+from catalog.models import BookInstance
+
+
+class Command(BaseCommand):
+    help = 'Move retired copies to the archive table and purge expired sessions in bounded batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--status', action='append', dest='statuses',
+                            help='Copy status to archive (repeatable, default: w). Use "m" to include maintenance.')
+        parser.add_argument('--batch-size', type=int, default=archive.ARCHIVE_BATCH_SIZE)
+        parser.add_argument('--sleep', type=float, default=0.1, help='Seconds to pause between batches')
+        parser.add_argument('--skip-sessions', action='store_true', help='Do not purge expired sessions')
+
+    def handle(self, *args, **options):
+        statuses = options['statuses'] or list(archive.ARCHIVE_STATUSES)
+        known = dict(BookInstance.LOAN_STATUS)
+        unknown = [status for status in statuses if status not in known]
+        if unknown:
+            raise CommandError('Unknown status: {0}'.format(', '.join(unknown)))
+        if 'o' in statuses:
+            raise CommandError('Copies on loan cannot be archived')
+
+        def progress(label):
+            return lambda done: self.stdout.write('  {0}: {1}'.format(label, done))
+
+        copies = archive.archive_copies(statuses, options['batch_size'], options['sleep'],
+                                        progress('copies archived'))
+        self.stdout.write(self.style.SUCCESS('Archived {0} copies ({1})'.format(
+            copies, ', '.join(known[status] for status in statuses))))
+
+        if not options['skip_sessions']:
+            sessions = archive.purge_expired_sessions(options['batch_size'], options['sleep'],
+                                                      progress('sessions purged'))
+            self.stdout.write(self.style.SUCCESS('Purged {0} expired sessions'.format(sessions)))
@@ -0,0 +1,59 @@
+import datetime
+import timeit
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.management.base import BaseCommand
+from django.template import Context, Template
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+from catalog.models import Book, BookInstance
+
+
+ROW_WITH_REVERSE = Template(
+    "{% for borrower in bookinstance_list %}"
+    "<a href=\"{% url 'book-detail' borrower.book.pk %}\">{{ borrower.book.title }}</a>"
+    "<a href=\"{% url 'renew-book' borrower.id %}\">Renew</a>"
+    "{% endfor %}"
+)
+
+ROW_WITH_PREFIX = Template(
+    "{% load catalog_extras %}"
+    "{% for borrower in bookinstance_list %}"
+    "<a href=\"{{ borrower.book_id|pk_url:'book-detail' }}\">{{ borrower.book.title }}</a>"
+    "<a href=\"{{ borrower.id|pk_url:'renew-book' }}\">Renew</a>"
+    "{% endfor %}"
+)
+
+
+class Command(BaseCommand):
+    help = 'Measure template render time per row on large loan list pages (no database needed)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        borrower = User(pk=1, username='reader')
+        due_back = datetime.date.today()
+        copies = []
+        for number in range(rows):
+            book = Book(pk=number + 1, title='Book {0}'.format(number))
+            copies.append(BookInstance(book=book, imprint='Imprint', due_back=due_back, status='o', borrower=borrower))
+
+        request = RequestFactory().get('/catalog/borrowed/')
+        request.user = AnonymousUser()
+        context = {'bookinstance_list': copies}
+
+        results = [
+            ('rows, per-row {% url %}', lambda: ROW_WITH_REVERSE.render(Context(context))),
+            ('rows, reverse-prefix filter', lambda: ROW_WITH_PREFIX.render(Context(context))),
+            ('all_loaned_list.html page',
+             lambda: render_to_string('catalog/all_loaned_list.html', context, request=request)),
+        ]
+        for label, render in results:
+            render()
+            best = min(timeit.repeat(render, number=1, repeat=options['repeat']))
+            self.stdout.write('{0:<32} {1:8.2f} ms total {2:8.2f} us/row'.format(
+                label, best * 1000, best * 1e6 / rows))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from catalog import assets
+
+
+class Command(BaseCommand):
+    help = 'Concatenate and minify the vendored CSS/JS into catalog/static/bundles'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Exit with an error if a bundle is out of date')
+
+    def handle(self, *args, **options):
+        if options['check']:
+            stale = assets.stale_bundles()
+            if stale:
+                raise CommandError('Out of date: {0}. Run "manage.py build_assets".'.format(', '.join(stale)))
+            self.stdout.write('Bundles are up to date')
+            return
+        for name in assets.write_bundles():
+            self.stdout.write('Wrote {0}'.format(assets.bundle_path(name)))
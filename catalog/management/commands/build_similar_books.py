@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Precompute the top-k most similar books for every book (requires numpy and scipy)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-k', type=int, default=10)
+        parser.add_argument('--block-size', type=int, default=256,
+                            help='Books scored per block; memory grows with block size x catalog size')
+
+    def handle(self, *args, **options):
+        try:
+            from catalog import similarity
+        except ImportError as e:
+            raise CommandError('build_similar_books needs numpy and scipy: {0}'.format(e))
+
+        started = time.monotonic()
+
+        def progress(done, total):
+            self.stdout.write('  {0}/{1} books ({2:.1f}s)'.format(done, total, time.monotonic() - started))
+
+        written = similarity.rebuild(options['top_k'], options['block_size'], progress)
+        self.stdout.write(self.style.SUCCESS('Stored {0} neighbours in {1:.1f}s'.format(
+            written, time.monotonic() - started)))
@@ -0,0 +1,41 @@
+import gzip
+import os
+
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+
+from catalog import sitemaps
+
+
+class Command(BaseCommand):
+    help = 'Write the sitemap index and chunked sitemaps as precompressed .xml.gz files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', required=True, help='Site root, e.g. https://example.com')
+        parser.add_argument('--output-dir', default=sitemaps.sitemap_dir(),
+                            help='Default: CATALOG_SITEMAP_DIR, which the site serves itself')
+        parser.add_argument('--sitemap-url', help='URL the output directory is served from '
+                                                  '(default: <base-url>/catalog/sitemaps/)')
+
+    def handle(self, *args, **options):
+        base_url = options['base_url'].rstrip('/')
+        default_url = base_url + reverse('sitemap-file', args=['sitemap.xml.gz']).rsplit('/', 1)[0]
+        sitemap_url = (options['sitemap_url'] or default_url).rstrip('/') + '/'
+        output_dir = options['output_dir']
+        os.makedirs(output_dir, exist_ok=True)
+
+        for section in sitemaps.SECTIONS:
+            for chunk in sitemaps.chunk_numbers(section):
+                self.write(output_dir, sitemaps.chunk_filename(section, chunk),
+                           sitemaps.iter_urlset(base_url, section, chunk))
+
+        self.write(output_dir, 'sitemap.xml.gz',
+                   sitemaps.iter_index(lambda section, chunk: sitemap_url + sitemaps.chunk_filename(section, chunk)))
+
+    def write(self, output_dir, name, lines):
+        path = os.path.join(output_dir, name)
+        # Write next to the target and rename, so readers never see a partial file.
+        with gzip.open(path + '.tmp', 'wt', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(path + '.tmp', path)
+        self.stdout.write('Wrote {0}'.format(path))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from catalog import dedupe
+from catalog.models import Author
+
+
+class Command(BaseCommand):
+    help = 'Merge near-duplicate authors found by blocking on surname, first initial and birth year'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threshold', type=float, default=dedupe.DEFAULT_THRESHOLD,
+                            help='Minimum first-name similarity (0-1) for a pair to be merged')
+        parser.add_argument('--max-block-size', type=int, default=dedupe.MAX_BLOCK_SIZE,
+                            help='Authors compared pairwise at most; larger blocks are split by first name')
+        parser.add_argument('--dry-run', action='store_true', help='Only report the groups that would be merged')
+
+    def handle(self, *args, **options):
+        groups = dedupe.find_duplicates(dedupe.iter_authors(), options['threshold'], options['max_block_size'])
+        duplicates = sum(len(pks) for pks in groups.values())
+        self.stdout.write('Found {0} duplicate authors in {1} groups'.format(duplicates, len(groups)))
+
+        if options['verbosity'] > 1 or options['dry_run']:
+            names = Author.objects.in_bulk(list(groups) + [pk for pks in groups.values() for pk in pks])
+            for canonical, pks in groups.items():
+                self.stdout.write('  {0} <- {1}'.format(
+                    names[canonical], '; '.join(str(names[pk]) for pk in pks)))
+
+        if options['dry_run'] or not groups:
+            return
+        books = dedupe.merge(groups)
+        self.stdout.write(self.style.SUCCESS('Merged {0} authors, repointed {1} books'.format(duplicates, books)))
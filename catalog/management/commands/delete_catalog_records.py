@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from catalog import deletion
+from catalog.models import Author, Book
+
+
+class Command(BaseCommand):
+    help = 'Delete authors or books with many dependents in chunks, reporting progress'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--author', type=int, action='append', default=[], help='Author id (repeatable)')
+        parser.add_argument('--book', type=int, action='append', default=[], help='Book id (repeatable)')
+        parser.add_argument('--chunk-size', type=int, default=deletion.DELETE_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        if not options['author'] and not options['book']:
+            raise CommandError('Give at least one --author or --book')
+
+        targets = [(Author, pk, deletion.delete_author, 'books') for pk in options['author']]
+        targets += [(Book, pk, deletion.delete_book, 'copies') for pk in options['book']]
+        for model, pk, delete, dependents in targets:
+            obj = model.objects.filter(pk=pk).first()
+            if obj is None:
+                self.stderr.write('{0} {1} does not exist, skipping'.format(model.__name__, pk))
+                continue
+
+            def progress(done):
+                self.stdout.write('  {0} {1}: detached {2} {3}'.format(model.__name__, pk, done, dependents))
+
+            self.stdout.write('Deleting {0} {1} ({2})'.format(model.__name__, pk, obj))
+            total = delete(pk, chunk_size=options['chunk_size'], progress=progress)
+            self.stdout.write(self.style.SUCCESS('Deleted {0} {1}, detached {2} {3}'.format(
+                model.__name__, pk, total, dependents)))
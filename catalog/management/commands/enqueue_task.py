@@ -0,0 +1,27 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from catalog import tasks
+
+
+class Command(BaseCommand):
+    help = 'Queue a background task, e.g. from a nightly scheduler'
+
+    def add_arguments(self, parser):
+        parser.add_argument('name', help='Task name, e.g. send_loan_reminders')
+        parser.add_argument('--payload', default='{}', help='JSON object of keyword arguments')
+
+    def handle(self, *args, **options):
+        try:
+            kwargs = json.loads(options['payload'])
+        except ValueError:
+            raise CommandError('--payload must be a JSON object')
+        if not isinstance(kwargs, dict):
+            raise CommandError('--payload must be a JSON object')
+
+        try:
+            job = tasks.enqueue(options['name'], **kwargs)
+        except LookupError as e:
+            raise CommandError(str(e))
+        self.stdout.write('Queued job {0}'.format(job.pk))
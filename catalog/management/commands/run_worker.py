@@ -0,0 +1,69 @@
+import logging
+import multiprocessing
+import os
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from catalog import tasks
+
+
+logger = logging.getLogger(__name__)
+
+MAX_ERROR_BACKOFF = 60
+
+
+def work(batch_size, sleep, burst):
+    worker_id = '{0}-{1}'.format(os.getpid(), uuid.uuid4().hex[:8])
+    errors = 0
+    while True:
+        try:
+            tasks.release_stale_jobs()
+            ran = tasks.run_pending(batch_size, worker_id)
+        except Exception:
+            # A database hiccup must not take the worker down with it; back off and retry.
+            errors += 1
+            backoff = min(max(sleep, 1) * 2 ** (errors - 1), MAX_ERROR_BACKOFF)
+            logger.exception('Worker %s failed to process the queue, retrying in %.1fs', worker_id, backoff)
+            connections.close_all()
+            time.sleep(backoff)
+            continue
+        errors = 0
+        if ran:
+            continue
+        if burst:
+            return
+        time.sleep(sleep)
+
+
+class Command(BaseCommand):
+    help = 'Run background jobs from the database queue'
+
+    def add_arguments(self, parser):
+        # cpu_count() reports the host's CPUs on shared hosts such as Heroku dynos.
+        parser.add_argument('--processes', type=int, default=int(os.environ.get('WORKER_PROCESSES', 1)),
+                            help='Number of worker processes (default: $WORKER_PROCESSES or 1)')
+        parser.add_argument('--batch-size', type=int, default=10, help='Jobs claimed per round trip')
+        parser.add_argument('--sleep', type=float, default=5, help='Seconds to wait when the queue is empty')
+        parser.add_argument('--burst', action='store_true', help='Exit once the queue is empty')
+
+    def handle(self, *args, **options):
+        args = (options['batch_size'], options['sleep'], options['burst'])
+        if options['processes'] <= 1:
+            work(*args)
+            return
+
+        # Forked children must not share the parent's database socket.
+        connections.close_all()
+        processes = [multiprocessing.Process(target=work, args=args) for _ in range(options['processes'])]
+        for process in processes:
+            process.start()
+        self.stdout.write('Started {0} worker processes'.format(len(processes)))
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
@@ -0,0 +1,20 @@
+from . import profiling
+
+
+class ProfilingMiddleware:
+    """
+    Profile a view when a staff user sends ``X-Profile`` or ``?_profile=1``.
+
+    Other requests only pay for one header lookup and one substring test.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not profiling.is_requested(request) or not request.user.is_staff:
+            return None
+        return profiling.profile_view(request, view_func, view_args, view_kwargs)
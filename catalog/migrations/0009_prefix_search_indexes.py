@@ -0,0 +1,43 @@
+from django.db import migrations
+
+
+PREFIX_INDEXES = [
+    ('catalog_author', 'last_name'),
+    ('catalog_genre', 'name'),
+    ('catalog_language', 'name'),
+]
+
+
+def index_name(table, column):
+    return '{0}_{1}_prefix_idx'.format(table, column)
+
+
+def create_prefix_indexes(apps, schema_editor):
+    # istartswith compiles to UPPER(col) LIKE on PostgreSQL and to a
+    # case-insensitive LIKE on SQLite; each needs its own index shape.
+    vendor = schema_editor.connection.vendor
+    for table, column in PREFIX_INDEXES:
+        if vendor == 'postgresql':
+            schema_editor.execute('CREATE INDEX {0} ON {1} (UPPER({2}::text) text_pattern_ops)'.format(
+                index_name(table, column), table, column))
+        elif vendor == 'sqlite':
+            schema_editor.execute('CREATE INDEX {0} ON {1} ({2} COLLATE NOCASE)'.format(
+                index_name(table, column), table, column))
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor not in ('postgresql', 'sqlite'):
+        return
+    for table, column in PREFIX_INDEXES:
+        schema_editor.execute('DROP INDEX IF EXISTS {0}'.format(index_name(table, column)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0008_author_name_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.0.14 on 2026-10-19 10:34
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('catalog', '0011_archivedbookinstance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestProfile',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url_name', models.CharField(max_length=200)),
+                ('path', models.CharField(max_length=2000)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('duration', models.FloatField(help_text='Wall time in milliseconds')),
+                ('query_count', models.PositiveIntegerField(default=0)),
+                ('stacks', models.TextField(help_text='Collapsed stacks ("frame;frame;frame microseconds" per line)')),
+                ('sql', models.TextField(default='[]', help_text='JSON encoded SQL timeline')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='requestprofile',
+            index=models.Index(fields=['url_name', '-created'], name='catalog_req_url_nam_1cb9b9_idx'),
+        ),
+    ]
@@ -1,8 +1,9 @@
-from django.urls import reverse
 from django.db import models
 import uuid
 from django.contrib.auth.models import User
+from django.utils import timezone
 from datetime import date
+from .utils import pk_url
 
 
 class Genre(models.Model):
@@ -33,7 +34,7 @@ class Book(models.Model):
         return self.title
 
     def get_absolute_url(self):
-        return reverse('book-detail', args=[str(self.id)])
+        return pk_url('book-detail', self.id)
 
     def display_genre(self):
         return ', '.join([genre.name for genre in self.genre.all()[:3]])
@@ -53,12 +54,14 @@ class BookInstance(models.Model):
         ('o', 'On loan'),
         ('a', 'Available'),
         ('r', 'Reversed'),
+        ('w', 'Withdrawn'),
     )
 
     status = models.CharField(max_length=1, choices=LOAN_STATUS, blank=True, default='m', help_text='Book availability')
 
     class Meta:
         ordering = ['due_back']
+        indexes = [models.Index(fields=['status', 'due_back'])]
         permissions = (('can_mark_returned', 'Set book as returned'),)
 
     @property
@@ -71,14 +74,97 @@ class BookInstance(models.Model):
         return '{0} ({1})'.format(self.id, self.book.title)
 
 
+class ArchivedBookInstance(models.Model):
+    """A copy moved out of :class:`BookInstance` by ``manage.py archive_stale_data``."""
+    id = models.UUIDField(primary_key=True, help_text='Unique ID')
+    book = models.ForeignKey('Book', on_delete=models.DO_NOTHING, null=True, db_constraint=False,
+                             related_name='archived_copies')
+    imprint = models.CharField(max_length=200)
+    due_back = models.DateField(null=True, blank=True)
+    borrower = models.ForeignKey(User, on_delete=models.DO_NOTHING, null=True, blank=True, db_constraint=False,
+                                 related_name='+')
+    status = models.CharField(max_length=1, choices=BookInstance.LOAN_STATUS, blank=True)
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-archived_at']
+
+    def __str__(self):
+        return '{0} (archived)'.format(self.id)
+
+
 class Author(models.Model):
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     date_of_birth = models.DateField(null=True, blank=True)
     date_of_death = models.DateField('died', null=True, blank=True)
 
+    class Meta:
+        ordering = ['last_name', 'first_name']
+        indexes = [models.Index(fields=['last_name', 'first_name'])]
+
     def get_absolute_url(self):
-        return reverse('author-detail', args=[str(self.id)])
+        return pk_url('author-detail', self.id)
 
     def __str__(self):
         return '{0}, {1}'.format(self.last_name, self.first_name)
+
+
+class SimilarBook(models.Model):
+    book = models.ForeignKey('Book', on_delete=models.CASCADE, related_name='similar_entries')
+    similar = models.ForeignKey('Book', on_delete=models.CASCADE, related_name='+')
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        ordering = ['book', 'rank']
+        unique_together = ('book', 'rank')
+
+    def __str__(self):
+        return '{0} -> {1} ({2:.2f})'.format(self.book_id, self.similar_id, self.score)
+
+
+class Job(models.Model):
+    name = models.CharField(max_length=100)
+    payload = models.TextField(default='{}', help_text='JSON encoded keyword arguments')
+
+    JOB_STATUS = (
+        ('q', 'Queued'),
+        ('r', 'Running'),
+        ('d', 'Done'),
+        ('f', 'Failed'),
+    )
+
+    status = models.CharField(max_length=1, choices=JOB_STATUS, default='q')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=64, blank=True)
+    last_error = models.TextField(blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['run_at']
+        indexes = [models.Index(fields=['status', 'run_at'])]
+
+    def __str__(self):
+        return '{0} ({1})'.format(self.name, self.get_status_display())
+
+
+class RequestProfile(models.Model):
+    url_name = models.CharField(max_length=200)
+    path = models.CharField(max_length=2000)
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    duration = models.FloatField(help_text='Wall time in milliseconds')
+    query_count = models.PositiveIntegerField(default=0)
+    stacks = models.TextField(help_text='Collapsed stacks ("frame;frame;frame microseconds" per line)')
+    sql = models.TextField(default='[]', help_text='JSON encoded SQL timeline')
+
+    class Meta:
+        ordering = ['-created']
+        indexes = [models.Index(fields=['url_name', '-created'])]
+
+    def __str__(self):
+        return '{0} {1} ({2:.0f} ms)'.format(self.url_name, self.created, self.duration)
@@ -0,0 +1,114 @@
+import json
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.db import connections
+
+from .models import RequestProfile
+
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+PROFILE_PARAM = '_profile'
+PROFILES_KEPT_PER_URL = 50
+
+
+class StackProfiler:
+    """
+    Deterministic profiler that records self time per full call stack.
+
+    The result is in the collapsed format read by flamegraph.pl and
+    speedscope: one ``frame;frame;frame microseconds`` line per stack.
+    Only the calling thread is profiled.
+    """
+
+    def __init__(self):
+        self.stack = []
+        self.times = Counter()
+        self.last = None
+
+    def __enter__(self):
+        self.last = time.perf_counter()
+        sys.setprofile(self.callback)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.setprofile(None)
+        self.account(time.perf_counter())
+
+    def account(self, now):
+        if self.stack:
+            self.times[tuple(self.stack)] += now - self.last
+        self.last = now
+
+    def callback(self, frame, event, arg):
+        self.account(time.perf_counter())
+        if event == 'call':
+            code = frame.f_code
+            self.stack.append('{0} ({1}:{2})'.format(code.co_name, os.path.basename(code.co_filename),
+                                                     code.co_firstlineno))
+        elif event == 'c_call':
+            self.stack.append(getattr(arg, '__qualname__', None) or getattr(arg, '__name__', repr(arg)))
+        elif self.stack:
+            self.stack.pop()
+
+    def collapsed(self):
+        lines = []
+        for stack, seconds in sorted(self.times.items()):
+            micros = int(seconds * 1e6)
+            if micros:
+                lines.append('{0} {1}'.format(';'.join(frame.replace(';', ':') for frame in stack), micros))
+        return '\n'.join(lines) + '\n'
+
+
+class SqlTimeline:
+    """Database ``execute_wrapper`` recording each query with its offset and duration in ms."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            end = time.perf_counter()
+            self.queries.append({
+                'alias': context['connection'].alias,
+                'sql': sql,
+                'start': round((start - self.started) * 1000, 3),
+                'duration': round((end - start) * 1000, 3),
+            })
+
+
+def is_requested(request):
+    if PROFILE_HEADER in request.META:
+        return True
+    # Cheap substring test first so unprofiled requests never parse the query string here.
+    return PROFILE_PARAM in request.META.get('QUERY_STRING', '') and PROFILE_PARAM in request.GET
+
+
+def profile_view(request, view_func, view_args, view_kwargs):
+    timeline = SqlTimeline()
+    started = time.perf_counter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(timeline))
+        with StackProfiler() as profiler:
+            response = view_func(request, *view_args, **view_kwargs)
+            if hasattr(response, 'render') and callable(response.render):
+                response = response.render()
+    duration = (time.perf_counter() - started) * 1000
+
+    url_name = request.resolver_match.view_name if request.resolver_match else ''
+    profile = RequestProfile.objects.create(
+        url_name=url_name, path=request.get_full_path()[:2000], user=request.user, duration=duration,
+        query_count=len(timeline.queries), stacks=profiler.collapsed(), sql=json.dumps(timeline.queries))
+    stale = RequestProfile.objects.filter(url_name=url_name).values_list('pk', flat=True)[PROFILES_KEPT_PER_URL:]
+    RequestProfile.objects.filter(pk__in=list(stale)).delete()
+
+    response['X-Profile-Id'] = str(profile.pk)
+    return response
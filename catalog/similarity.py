@@ -0,0 +1,124 @@
+"""
+Vectorized "similar books" computation.
+
+Books are encoded as rows of a sparse binary feature matrix (genres, author,
+language) and compared with a weighted Jaccard score, one dense block of rows
+against the whole catalog at a time. Requires NumPy and SciPy.
+"""
+
+import numpy as np
+from scipy import sparse
+
+from django.db import transaction
+
+from .models import Book, SimilarBook
+
+
+GENRE_WEIGHT = 1.0
+AUTHOR_WEIGHT = 2.0
+LANGUAGE_WEIGHT = 0.5
+
+
+def pairs(queryset, *fields):
+    rows = np.array(list(queryset.values_list(*fields)), dtype=np.int64)
+    return rows.reshape(-1, 2)
+
+
+def load_features():
+    """
+    Return ``(book_ids, weighted, binary)`` for every book.
+
+    Row ``i`` of both matrices describes ``book_ids[i]``; ``weighted`` holds
+    the feature weight where ``binary`` holds 1. The queries are not one
+    snapshot, so links to books created after ``book_ids`` was read are dropped.
+    """
+    book_ids = np.array(Book.objects.order_by('pk').values_list('pk', flat=True), dtype=np.int64)
+    groups = [
+        (pairs(Book.genre.through.objects.all(), 'book_id', 'genre_id'), GENRE_WEIGHT),
+        (pairs(Book.objects.filter(author__isnull=False), 'pk', 'author_id'), AUTHOR_WEIGHT),
+        (pairs(Book.objects.filter(language__isnull=False), 'pk', 'language_id'), LANGUAGE_WEIGHT),
+    ]
+
+    rows, cols, weights = [], [], []
+    offset = 0
+    for links, weight in groups:
+        links = links[np.isin(links[:, 0], book_ids)]
+        values, columns = np.unique(links[:, 1], return_inverse=True)
+        rows.append(np.searchsorted(book_ids, links[:, 0]))
+        cols.append(columns.reshape(-1) + offset)
+        weights.append(np.full(len(links), weight, dtype=np.float32))
+        offset += len(values)
+
+    rows, cols, weights = np.concatenate(rows), np.concatenate(cols), np.concatenate(weights)
+    shape = (len(book_ids), offset)
+    weighted = sparse.csr_matrix((weights, (rows, cols)), shape=shape)
+    binary = sparse.csr_matrix((np.ones_like(weights), (rows, cols)), shape=shape)
+    return book_ids, weighted, binary
+
+
+def iter_top_k(weighted, binary, top_k=10, block_size=256):
+    """
+    Yield ``(row, neighbour_rows, scores)`` for every row, best neighbour first.
+
+    Weighted Jaccard is ``sum(min) / sum(max)``, which for binary features is
+    ``intersection / (size_a + size_b - intersection)``; the intersection of a
+    block of rows with every book is one sparse matrix product.
+    """
+    count = weighted.shape[0]
+    k = min(top_k, count - 1)
+    if k <= 0:
+        return
+
+    sizes = np.asarray(weighted.sum(axis=1), dtype=np.float32).ravel()
+    binary_t = binary.T.tocsc()
+    for start in range(0, count, block_size):
+        end = min(start + block_size, count)
+        intersection = (weighted[start:end] @ binary_t).toarray().astype(np.float32)
+        union = sizes[start:end, None] + sizes[None, :] - intersection
+        scores = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+        scores[np.arange(end - start), np.arange(start, end)] = -1
+
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(scores, best, axis=1)
+        order = np.argsort(-best_scores, axis=1)
+        best = np.take_along_axis(best, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+
+        for offset in range(end - start):
+            keep = best_scores[offset] > 0
+            yield start + offset, best[offset][keep], best_scores[offset][keep]
+
+
+def replace_neighbours(book_ids, entries):
+    with transaction.atomic():
+        # Books deleted since the features were loaded would violate the foreign keys.
+        referenced = {entry.book_id for entry in entries} | {entry.similar_id for entry in entries}
+        existing = set(Book.objects.filter(pk__in=referenced).values_list('pk', flat=True))
+        entries = [entry for entry in entries if entry.book_id in existing and entry.similar_id in existing]
+        SimilarBook.objects.filter(book_id__in=book_ids).delete()
+        SimilarBook.objects.bulk_create(entries, batch_size=1000)
+    return len(entries)
+
+
+def rebuild(top_k=10, block_size=256, progress=None):
+    book_ids, weighted, binary = load_features()
+    block_books, entries = [], []
+    written = 0
+
+    for row, neighbours, scores in iter_top_k(weighted, binary, top_k, block_size):
+        book_id = int(book_ids[row])
+        block_books.append(book_id)
+        for rank, (neighbour, score) in enumerate(zip(neighbours, scores), 1):
+            entries.append(SimilarBook(book_id=book_id, similar_id=int(book_ids[neighbour]),
+                                       score=float(score), rank=rank))
+        if len(block_books) >= block_size:
+            written += replace_neighbours(block_books, entries)
+            block_books, entries = [], []
+            if progress is not None:
+                progress(row + 1, len(book_ids))
+
+    if block_books:
+        written += replace_neighbours(block_books, entries)
+    if progress is not None:
+        progress(len(book_ids), len(book_ids))
+    return written
@@ -0,0 +1,81 @@
+import os
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import F, Max
+
+from .models import Author, Book
+from .utils import pk_url
+
+
+SITEMAP_CHUNK_SIZE = 50000
+ITER_BATCH_SIZE = 5000
+
+SECTIONS = {
+    'books': (Book, 'book-detail'),
+    'authors': (Author, 'author-detail'),
+}
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+XMLNS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+
+def sitemap_dir():
+    return getattr(settings, 'CATALOG_SITEMAP_DIR', os.path.join(settings.BASE_DIR, 'sitemaps'))
+
+
+def chunk_filename(section, chunk):
+    return 'sitemap-{0}-{1}.xml.gz'.format(section, chunk)
+
+
+def chunk_numbers(section):
+    """
+    Numbers of the non-empty chunks of ``section``, in one grouped query.
+
+    Chunk ``n`` holds the rows with ``(n - 1) * SITEMAP_CHUNK_SIZE < pk <= n * SITEMAP_CHUNK_SIZE``,
+    so a chunk never exceeds the sitemap limit and is located without OFFSET.
+    """
+    model, url_name = SECTIONS[section]
+    chunks = model.objects.annotate(chunk=(F('pk') - 1) / SITEMAP_CHUNK_SIZE + 1)
+    return list(chunks.order_by('chunk').values_list('chunk', flat=True).distinct())
+
+
+def chunk_exists(section, chunk):
+    """Whether ``chunk`` of ``section`` holds any rows; numbers past the last chunk are never queried."""
+    model, url_name = SECTIONS[section]
+    last_pk = model.objects.aggregate(last=Max('pk'))['last']
+    if last_pk is None or not 1 <= chunk <= (last_pk - 1) // SITEMAP_CHUNK_SIZE + 1:
+        return False
+    return model.objects.filter(pk__gt=(chunk - 1) * SITEMAP_CHUNK_SIZE, pk__lte=chunk * SITEMAP_CHUNK_SIZE).exists()
+
+
+def iter_pks(model, chunk, batch_size=ITER_BATCH_SIZE):
+    last = (chunk - 1) * SITEMAP_CHUNK_SIZE
+    high = chunk * SITEMAP_CHUNK_SIZE
+    while True:
+        pks = list(model.objects.filter(pk__gt=last, pk__lte=high)
+                   .order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return
+        yield from pks
+        last = pks[-1]
+
+
+def iter_urlset(base_url, section, chunk):
+    model, url_name = SECTIONS[section]
+    base_url = escape(base_url)
+    yield XML_HEADER
+    yield '<urlset xmlns="{0}">\n'.format(XMLNS)
+    for pk in iter_pks(model, chunk):
+        yield '<url><loc>{0}{1}</loc></url>\n'.format(base_url, pk_url(url_name, pk))
+    yield '</urlset>\n'
+
+
+def iter_index(location):
+    """``location(section, chunk)`` returns the absolute URL of a chunk file."""
+    yield XML_HEADER
+    yield '<sitemapindex xmlns="{0}">\n'.format(XMLNS)
+    for section in SECTIONS:
+        for chunk in chunk_numbers(section):
+            yield '<sitemap><loc>{0}</loc></sitemap>\n'.format(escape(location(section, chunk)))
+    yield '</sitemapindex>\n'
@@ -0,0 +1,70 @@
+(function () {
+    'use strict';
+
+    function debounce(fn, wait) {
+        var timer;
+        return function () {
+            var args = arguments;
+            clearTimeout(timer);
+            timer = setTimeout(function () { fn.apply(null, args); }, wait);
+        };
+    }
+
+    function addOption(select, id, text) {
+        var value = String(id);
+        for (var i = 0; i < select.options.length; i++) {
+            if (select.options[i].value === value) {
+                select.options[i].selected = true;
+                return;
+            }
+        }
+        var option = new Option(text, value, true, true);
+        select.add(option);
+    }
+
+    function attach(select) {
+        var input = document.createElement('input');
+        var list = document.createElement('ul');
+        input.type = 'search';
+        input.placeholder = 'Type to search...';
+        input.setAttribute('autocomplete', 'off');
+        list.className = 'autocomplete-results';
+        select.parentNode.insertBefore(input, select);
+        select.parentNode.insertBefore(list, select);
+
+        var search = debounce(function (term) {
+            list.innerHTML = '';
+            if (!term) {
+                return;
+            }
+            fetch(select.dataset.autocompleteUrl + '?q=' + encodeURIComponent(term), {credentials: 'same-origin'})
+                .then(function (response) { return response.json(); })
+                .then(function (data) {
+                    if (input.value.trim() !== term) {
+                        return;
+                    }
+                    data.results.forEach(function (result) {
+                        var item = document.createElement('li');
+                        item.textContent = result.text;
+                        item.addEventListener('mousedown', function (event) {
+                            event.preventDefault();
+                            addOption(select, result.id, result.text);
+                            input.value = '';
+                            list.innerHTML = '';
+                        });
+                        list.appendChild(item);
+                    });
+                });
+        }, 200);
+
+        input.addEventListener('input', function () { search(input.value.trim()); });
+        input.addEventListener('blur', function () { list.innerHTML = ''; });
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        var selects = document.querySelectorAll('select[data-autocomplete-url]');
+        for (var i = 0; i < selects.length; i++) {
+            attach(selects[i]);
+        }
+    });
+})();
@@ -0,0 +1,142 @@
+import datetime
+import json
+import traceback
+import uuid
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import deletion
+from .models import BookInstance, Job
+
+
+RETRY_BASE_DELAY = 30
+RETRY_MAX_DELAY = 60 * 60
+STALE_JOB_TIMEOUT = 30 * 60
+
+registry = {}
+
+
+def task(func):
+    registry[func.__name__] = func
+    return func
+
+
+def enqueue(name, run_at=None, max_attempts=5, **kwargs):
+    if name not in registry:
+        raise LookupError('Unknown task: {0}'.format(name))
+    return Job.objects.create(name=name, payload=json.dumps(kwargs), max_attempts=max_attempts,
+                              run_at=run_at or timezone.now())
+
+
+def claim_jobs(limit, worker_id=None):
+    """
+    Mark up to ``limit`` due jobs as running for this worker and return them.
+
+    Backends that support ``SKIP LOCKED`` let concurrent workers claim disjoint
+    batches without waiting on each other. Elsewhere (SQLite) the jobs are
+    claimed with a single ``UPDATE ... WHERE id IN (SELECT ... LIMIT n)``, which
+    takes the write lock up front instead of upgrading a read lock mid-transaction.
+    """
+    worker_id = worker_id or uuid.uuid4().hex
+    now = timezone.now()
+    due = Job.objects.filter(status__exact='q', run_at__lte=now).order_by('run_at')
+    claim = dict(status='r', locked_at=now, locked_by=worker_id, attempts=F('attempts') + 1)
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            ids = list(due.select_for_update(skip_locked=True).values_list('pk', flat=True)[:limit])
+            Job.objects.filter(pk__in=ids).update(**claim)
+        claimed = Job.objects.filter(pk__in=ids)
+    else:
+        Job.objects.filter(pk__in=due.values('pk')[:limit], status__exact='q').update(**claim)
+        claimed = Job.objects.filter(locked_at=now)
+
+    return list(claimed.filter(status__exact='r', locked_by=worker_id).order_by('run_at'))
+
+
+def release_stale_jobs(timeout=STALE_JOB_TIMEOUT):
+    """Requeue jobs whose worker died, failing those that have used up their attempts."""
+    cutoff = timezone.now() - datetime.timedelta(seconds=timeout)
+    stale = Job.objects.filter(status__exact='r', locked_at__lt=cutoff)
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status='f', locked_by='', last_error='Worker stopped while running the job')
+    return stale.update(status='q', locked_by='')
+
+
+def retry_delay(attempts):
+    return datetime.timedelta(seconds=min(RETRY_BASE_DELAY * 2 ** max(attempts - 1, 0), RETRY_MAX_DELAY))
+
+
+def run_job(job):
+    try:
+        func = registry[job.name]
+        func(**json.loads(job.payload))
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts >= job.max_attempts:
+            job.status = 'f'
+        else:
+            job.status = 'q'
+            job.run_at = timezone.now() + retry_delay(job.attempts)
+    else:
+        job.status = 'd'
+        job.last_error = ''
+
+    job.locked_by = ''
+    job.save(update_fields=['status', 'run_at', 'locked_by', 'last_error'])
+    return job.status == 'd'
+
+
+def run_pending(batch_size=10, worker_id=None):
+    jobs = claim_jobs(batch_size, worker_id)
+    for job in jobs:
+        run_job(job)
+    return len(jobs)
+
+
+def reminder_message(inst, today):
+    if inst.due_back < today:
+        subject = 'Overdue: {0}'.format(inst.book.title)
+        body = 'Your copy of "{0}" was due back on {1}. Please return it as soon as possible.'
+    else:
+        subject = 'Due soon: {0}'.format(inst.book.title)
+        body = 'Your copy of "{0}" is due back on {1}.'
+    return EmailMessage(subject, body.format(inst.book.title, inst.due_back),
+                        settings.DEFAULT_FROM_EMAIL, [inst.borrower.email])
+
+
+@task
+def send_loan_reminders(days=3, batch_size=100):
+    today = datetime.date.today()
+    loans = (BookInstance.objects
+             .filter(status__exact='o', due_back__lte=today + datetime.timedelta(days=days),
+                     book__isnull=False, borrower__isnull=False)
+             .exclude(borrower__email='')
+             .select_related('book', 'borrower')
+             .order_by('due_back', 'pk'))
+
+    sent = 0
+    batch = []
+    with get_connection() as mail:
+        for inst in loans.iterator(chunk_size=batch_size):
+            batch.append(reminder_message(inst, today))
+            if len(batch) >= batch_size:
+                sent += mail.send_messages(batch) or 0
+                batch = []
+        if batch:
+            sent += mail.send_messages(batch) or 0
+    return sent
+
+
+@task
+def delete_author(pk):
+    deletion.delete_author(pk)
+
+
+@task
+def delete_book(pk):
+    deletion.delete_book(pk)
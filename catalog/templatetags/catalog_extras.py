@@ -0,0 +1,20 @@
+from django import template
+
+from catalog.utils import pk_url as build_pk_url
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def sidebar_profile(context):
+    user = context.get('user')
+    if user is None or not user.is_authenticated:
+        return 'anonymous'
+    if user.has_perm('catalog.can_mark_returned'):
+        return 'librarian'
+    return 'member'
+
+
+@register.filter
+def pk_url(pk, name):
+    return build_pk_url(name, pk)
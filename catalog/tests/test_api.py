@@ -0,0 +1,120 @@
+from django.test import TestCase
+from catalog import api
+from catalog.models import Author, BookInstance, Book, Genre, Language
+from django.urls import reverse
+from django.contrib.auth.models import User
+import datetime
+
+
+class BookApiViewTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(first_name='John', last_name='Smith')
+        cls.language = Language.objects.create(name='Ukrainian')
+        cls.genres = [Genre.objects.create(name='Fantasy'), Genre.objects.create(name='Poetry')]
+        for number in range(25):
+            book = Book.objects.create(title='Book %s' % number, summary='Summary', isbn='ABCDEFG',
+                                       author=cls.author, language=cls.language)
+            book.genre.set(cls.genres)
+
+    def test_first_page(self):
+        resp = self.client.get(reverse('api-books'))
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(len(data['results']), 20)
+        self.assertIsNotNone(data['next'])
+        self.assertEqual(data['results'][0]['author'], self.author.pk)
+        self.assertEqual(data['results'][0]['genre'], [genre.pk for genre in self.genres])
+
+    def test_cursor_pagination(self):
+        first = self.client.get(reverse('api-books'), {'limit': 10}).json()
+        second = self.client.get(reverse('api-books'), {'limit': 10, 'cursor': first['next']}).json()
+        third = self.client.get(reverse('api-books'), {'limit': 10, 'cursor': second['next']}).json()
+
+        ids = [row['id'] for page in (first, second, third) for row in page['results']]
+        self.assertEqual(ids, list(Book.objects.order_by('pk').values_list('pk', flat=True)))
+        self.assertIsNone(third['next'])
+
+    def test_sparse_fieldset(self):
+        with self.assertNumQueries(1):
+            resp = self.client.get(reverse('api-books'), {'fields': 'title'})
+        self.assertEqual(set(resp.json()['results'][0]), {'id', 'title'})
+
+    def test_unknown_field(self):
+        resp = self.client.get(reverse('api-books'), {'fields': 'title,secret'})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_batch_fetch_by_ids(self):
+        ids = list(Book.objects.order_by('-pk').values_list('pk', flat=True)[:3])
+        with self.assertNumQueries(1):
+            resp = self.client.get(reverse('api-books'), {'ids': ','.join(map(str, ids)), 'fields': 'title'})
+        self.assertEqual(sorted(row['id'] for row in resp.json()['results']), sorted(ids))
+
+    def test_invalid_ids(self):
+        resp = self.client.get(reverse('api-books'), {'ids': 'abc'})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_out_of_range_ids_and_cursor(self):
+        huge = '99999999999999999999999'
+        self.assertEqual(self.client.get(reverse('api-books'), {'ids': huge}).status_code, 400)
+        resp = self.client.get(reverse('api-books'), {'cursor': api.encode_cursor(huge)})
+        self.assertEqual(resp.status_code, 400)
+
+
+class LoanedApiViewTest(TestCase):
+
+    def setUp(self):
+        self.test_user1 = User.objects.create_user(username='test_user1', password='123')
+        test_user2 = User.objects.create_user(username='test_user2', password='456')
+        test_book = Book.objects.create(title='Book Title', summary='My book summary', isbn='ABCDEFG')
+
+        return_date = datetime.date.today() + datetime.timedelta(days=5)
+        self.loan = BookInstance.objects.create(book=test_book, imprint='Unlikely Imprint, 2016',
+                                                due_back=return_date, borrower=self.test_user1, status='o')
+        BookInstance.objects.create(book=test_book, imprint='Unlikely Imprint, 2016',
+                                    due_back=return_date, borrower=test_user2, status='o')
+        BookInstance.objects.create(book=test_book, imprint='Unlikely Imprint, 2016', status='a')
+
+    def test_requires_login(self):
+        resp = self.client.get(reverse('api-my-borrowed'))
+        self.assertEqual(resp.status_code, 401)
+
+    def test_only_own_loans(self):
+        self.client.login(username='test_user1', password='123')
+        resp = self.client.get(reverse('api-my-borrowed'))
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([row['id'] for row in resp.json()['results']], [str(self.loan.pk)])
+
+    def test_copies_cursor_over_uuid(self):
+        first = self.client.get(reverse('api-copies'), {'limit': 2}).json()
+        second = self.client.get(reverse('api-copies'), {'limit': 2, 'cursor': first['next']}).json()
+        self.assertEqual(len(first['results']) + len(second['results']), 3)
+        self.assertIsNone(second['next'])
+
+
+class AutocompleteViewTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Author.objects.create(first_name='John', last_name='Smith')
+        Author.objects.create(first_name='Adam', last_name='Smithson')
+        Author.objects.create(first_name='Jane', last_name='Austen')
+        Genre.objects.create(name='Fantasy')
+        Genre.objects.create(name='Fairy tale')
+
+    def test_author_prefix(self):
+        resp = self.client.get(reverse('autocomplete-author'), {'q': 'smi'})
+        self.assertEqual([row['text'] for row in resp.json()['results']], ['Smith, John', 'Smithson, Adam'])
+
+    def test_author_prefix_with_first_name(self):
+        resp = self.client.get(reverse('autocomplete-author'), {'q': 'smi, a'})
+        self.assertEqual([row['text'] for row in resp.json()['results']], ['Smithson, Adam'])
+
+    def test_genre_prefix(self):
+        resp = self.client.get(reverse('autocomplete-genre'), {'q': 'Fan'})
+        self.assertEqual([row['text'] for row in resp.json()['results']], ['Fantasy'])
+
+    def test_empty_query(self):
+        resp = self.client.get(reverse('autocomplete-language'))
+        self.assertEqual(resp.json(), {'results': []})
@@ -0,0 +1,60 @@
+from django.test import TestCase
+from django.core.management import call_command, CommandError
+from django.contrib.sessions.models import Session
+from django.urls import reverse
+from django.utils import timezone
+from catalog import archive
+from catalog.models import ArchivedBookInstance, Author, Book, BookInstance
+from io import StringIO
+import datetime
+
+
+class ArchiveTest(TestCase):
+
+    def setUp(self):
+        author = Author.objects.create(first_name='John', last_name='Smith')
+        self.book = Book.objects.create(title='Book Title', summary='My book summary', isbn='ABCDEFG', author=author)
+        for status in ('w', 'w', 'w', 'm', 'a'):
+            BookInstance.objects.create(book=self.book, imprint='Unlikely Imprint, 2016', status=status,
+                                        due_back=datetime.date(2016, 1, 1))
+
+    def test_archive_copies_in_batches(self):
+        withdrawn = set(BookInstance.objects.filter(status='w').values_list('pk', flat=True))
+        progress = []
+        self.assertEqual(archive.archive_copies(batch_size=2, progress=progress.append), 3)
+        self.assertEqual(progress, [2, 3])
+        self.assertFalse(BookInstance.objects.filter(status='w').exists())
+        self.assertEqual(set(ArchivedBookInstance.objects.values_list('pk', flat=True)), withdrawn)
+
+        copy = ArchivedBookInstance.objects.first()
+        self.assertEqual((copy.book, copy.imprint, copy.due_back), (self.book, 'Unlikely Imprint, 2016',
+                                                                     datetime.date(2016, 1, 1)))
+
+    def test_copy_checked_out_after_selection_is_not_archived(self):
+        ids = list(BookInstance.objects.filter(status='w').values_list('pk', flat=True))
+        BookInstance.objects.filter(pk=ids[0]).update(status='o')
+        self.assertEqual(archive.archive_batch(ids), 2)
+        self.assertTrue(BookInstance.objects.filter(pk=ids[0], status='o').exists())
+        self.assertFalse(ArchivedBookInstance.objects.filter(pk=ids[0]).exists())
+
+    def test_command_includes_maintenance_on_request(self):
+        call_command('archive_stale_data', statuses=['w', 'm'], sleep=0, stdout=StringIO())
+        self.assertEqual(list(BookInstance.objects.values_list('status', flat=True)), ['a'])
+
+    def test_command_refuses_loans(self):
+        with self.assertRaises(CommandError):
+            call_command('archive_stale_data', statuses=['o'], stdout=StringIO())
+
+    def test_purge_expired_sessions(self):
+        Session.objects.create(session_key='old', session_data='', expire_date=timezone.now() - datetime.timedelta(1))
+        Session.objects.create(session_key='new', session_data='', expire_date=timezone.now() + datetime.timedelta(1))
+        self.assertEqual(archive.purge_expired_sessions(batch_size=1), 1)
+        self.assertEqual(list(Session.objects.values_list('pk', flat=True)), ['new'])
+
+    def test_book_detail_reads_archive_on_demand(self):
+        archive.archive_copies()
+        for query in ('', '?archived=0'):
+            resp = self.client.get(reverse('book-detail', args=[self.book.pk]) + query)
+            self.assertNotIn('archived_copies', resp.context)
+        resp = self.client.get(reverse('book-detail', args=[self.book.pk]) + '?archived=1')
+        self.assertEqual(len(resp.context['archived_copies']), 3)
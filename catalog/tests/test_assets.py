@@ -0,0 +1,72 @@
+from django.test import SimpleTestCase, TestCase
+from django.templatetags.static import static
+from django.urls import reverse
+from catalog import assets, checks
+import os
+import tempfile
+
+
+class MinifyCssTest(SimpleTestCase):
+
+    def test_strips_comments_and_whitespace(self):
+        css = '/* nav */\n.a > .b ,\n.c {\n    color: red ;\n    margin: 0 auto;\n}\n'
+        self.assertEqual(assets.minify_css(css), '.a>.b,.c{color:red;margin:0 auto}')
+
+    def test_keeps_strings_licence_comments_and_descendant_pseudo_classes(self):
+        css = '/*! Licence, v1 */\n.a :hover { content: "a ,  b"; }'
+        self.assertEqual(assets.minify_css(css), '/*! Licence, v1 */.a :hover{content:"a ,  b"}')
+
+
+class BundleTest(SimpleTestCase):
+
+    def test_committed_bundles_are_up_to_date(self):
+        self.assertEqual(assets.stale_bundles(), [])
+
+    def test_js_bundle_loads_jquery_before_bootstrap(self):
+        bundle = assets.render_bundle('bundles/site.js')
+        self.assertLess(bundle.index('jQuery v'), bundle.index('Bootstrap v'))
+        self.assertNotIn('sourceMappingURL', bundle)
+
+
+class TemplateAssetCheckTest(SimpleTestCase):
+
+    def check(self, source):
+        with tempfile.NamedTemporaryFile('w', suffix='.html', delete=False) as f:
+            f.write(source)
+        self.addCleanup(os.remove, f.name)
+        return [error.id for error in checks.check_template(f.name)]
+
+    def test_static_references_pass(self):
+        self.assertEqual(self.check('<link rel="stylesheet" href="{% static \'bundles/site.css\' %}">\n'
+                                    '<a href="https://example.com/">Not an asset</a>'), [])
+
+    def test_external_asset(self):
+        self.assertEqual(self.check('<script src="https://code.jquery.com/jquery.js"></script>'), ['catalog.E001'])
+        self.assertEqual(self.check('<link href="//cdn.example.com/x.css" rel="stylesheet">'), ['catalog.E001'])
+
+    def test_unhashed_asset(self):
+        self.assertEqual(self.check('<img src="/static/logo.png">'), ['catalog.E002'])
+
+    def test_missing_static_file(self):
+        self.assertEqual(self.check('<script src="{% static \'js/missing.js\' %}"></script>'), ['catalog.E003'])
+
+    def test_project_templates_pass(self):
+        self.assertEqual(checks.check_template_assets(None), [])
+
+
+class AssetServingTest(TestCase):
+
+    def test_page_uses_hashed_bundles(self):
+        content = self.client.get(reverse('index')).content.decode()
+        for name in assets.BUNDLES:
+            url = static(name)
+            self.assertNotEqual(url, '/static/' + name)
+            self.assertIn(url, content)
+        self.assertNotIn('bootstrapcdn', content)
+
+    def test_hashed_bundle_is_precompressed_and_immutable(self):
+        resp = self.client.get(static('bundles/site.css'), HTTP_ACCEPT_ENCODING='br, gzip')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp['Content-Encoding'], 'br')
+        self.assertIn('immutable', resp['Cache-Control'])
+        resp.close()
@@ -0,0 +1,54 @@
+from django.test import TestCase
+from django.core.management import call_command
+from catalog import dedupe
+from catalog.models import Author, Book
+from io import StringIO
+import datetime
+
+
+class DedupeTest(TestCase):
+
+    def setUp(self):
+        born = datetime.date(1892, 1, 3)
+        self.tolkien = Author.objects.create(first_name='John', last_name='Tolkien', date_of_birth=born)
+        self.initial = Author.objects.create(first_name='J.', last_name='Tolkien', date_of_birth=born)
+        self.accented = Author.objects.create(first_name='John', last_name='Tólkien ', date_of_birth=born)
+        self.other_year = Author.objects.create(first_name='John', last_name='Tolkien',
+                                                date_of_birth=datetime.date(1950, 1, 1))
+        self.other_name = Author.objects.create(first_name='Jane', last_name='Tolkien', date_of_birth=born)
+        self.book = Book.objects.create(title='The Hobbit', summary='Summary', isbn='ABCDEFG', author=self.initial)
+
+    def test_blocking_key_folds_names(self):
+        self.assertEqual(dedupe.blocking_key('John', ' Tólkien', datetime.date(1892, 1, 3)), ('tolkien', 'j', 1892))
+
+    def test_find_duplicates_within_blocks(self):
+        groups = dedupe.find_duplicates(dedupe.iter_authors(batch_size=2))
+        self.assertEqual(groups, {self.tolkien.pk: [self.initial.pk, self.accented.pk]})
+
+    def test_oversized_blocks_are_split_by_first_name(self):
+        rows = [(pk, name, 'Smith', None) for pk, name in enumerate(['John'] * 3 + ['Joan'] * 2 + ['Jim'], 1)]
+        blocks = dedupe.build_blocks(rows, max_block_size=4)
+        self.assertEqual(sorted(len(block) for block in blocks), [2, 3])
+
+        with self.assertLogs('catalog.dedupe', 'WARNING'):
+            blocks = dedupe.build_blocks(rows, max_block_size=2)
+        self.assertTrue(all(len(block) <= 2 for block in blocks))
+
+    def test_only_candidate_pairs_are_scored(self):
+        folded = ['john', 'j', 'jon', 'xavier']
+        pairs = dedupe.candidate_pairs(folded, 0.75)
+        self.assertIn((0, 1), pairs)
+        self.assertIn((0, 2), pairs)
+        self.assertNotIn((0, 3), pairs)
+
+    def test_merge_repoints_books(self):
+        call_command('dedupe_authors', stdout=StringIO())
+        self.book.refresh_from_db()
+        self.assertEqual(self.book.author, self.tolkien)
+        self.assertEqual(Author.objects.count(), 3)
+
+    def test_dry_run(self):
+        out = StringIO()
+        call_command('dedupe_authors', dry_run=True, stdout=out)
+        self.assertIn('Found 2 duplicate authors in 1 groups', out.getvalue())
+        self.assertEqual(Author.objects.count(), 5)
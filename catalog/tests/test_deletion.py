@@ -0,0 +1,64 @@
+from django.test import TestCase, override_settings
+from django.core.management import call_command
+from django.urls import reverse
+from django.contrib.auth.models import User, Permission
+from catalog import deletion
+from catalog.models import Author, Book, BookInstance, Genre, Job
+from io import StringIO
+
+
+class DeletionTest(TestCase):
+
+    def setUp(self):
+        self.author = Author.objects.create(first_name='John', last_name='Smith')
+        self.genre = Genre.objects.create(name='Fantasy')
+        self.book = Book.objects.create(title='Book Title', summary='My book summary', isbn='ABCDEFG',
+                                        author=self.author)
+        self.book.genre.add(self.genre)
+        for copy in range(5):
+            BookInstance.objects.create(book=self.book, imprint='Unlikely Imprint, 2016')
+
+    def test_delete_book_nulls_copies_in_chunks(self):
+        progress = []
+        self.assertEqual(deletion.delete_book(self.book.pk, chunk_size=2, progress=progress.append), 5)
+        self.assertEqual(progress, [2, 4, 5])
+        self.assertFalse(Book.objects.exists())
+        self.assertEqual(BookInstance.objects.filter(book__isnull=True).count(), 5)
+        self.assertFalse(Book.genre.through.objects.exists())
+        self.assertTrue(Genre.objects.exists())
+
+    def test_delete_author_keeps_books(self):
+        deletion.delete_author(self.author.pk)
+        self.assertFalse(Author.objects.exists())
+        self.book.refresh_from_db()
+        self.assertIsNone(self.book.author)
+
+    def test_command_reports_progress(self):
+        out = StringIO()
+        call_command('delete_catalog_records', book=[self.book.pk], chunk_size=2, stdout=out)
+        self.assertIn('detached 4 copies', out.getvalue())
+        self.assertFalse(Book.objects.exists())
+
+
+class DeleteViewTest(TestCase):
+
+    def setUp(self):
+        librarian = User.objects.create_user(username='test_user2', password='456')
+        librarian.user_permissions.add(Permission.objects.get(name='Set book as returned'))
+        self.client.login(username='test_user2', password='456')
+
+        self.book = Book.objects.create(title='Book Title', summary='My book summary', isbn='ABCDEFG')
+        for copy in range(3):
+            BookInstance.objects.create(book=self.book, imprint='Unlikely Imprint, 2016')
+
+    def test_small_delete_runs_inline(self):
+        resp = self.client.post(reverse('book_delete', args=[self.book.pk]))
+        self.assertRedirects(resp, reverse('books'))
+        self.assertFalse(Book.objects.exists())
+
+    @override_settings(CATALOG_INLINE_DELETE_LIMIT=2)
+    def test_large_delete_is_queued(self):
+        resp = self.client.post(reverse('book_delete', args=[self.book.pk]))
+        self.assertTemplateUsed(resp, 'catalog/delete_scheduled.html')
+        self.assertTrue(Book.objects.exists())
+        self.assertEqual(Job.objects.get().name, 'delete_book')
@@ -1,5 +1,6 @@
 from django.test import TestCase
-from catalog.forms import RenewBookForm
+from catalog.forms import BookForm, RenewBookForm
+from catalog.models import Author, Genre, Language
 import datetime
 
 
@@ -40,3 +41,34 @@ class RenewBookFormTest(TestCase):
         form_data = {'renewal_date': date}
         form = RenewBookForm(data=form_data)
         self.assertTrue(form.is_valid())
+
+
+class BookFormTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.authors = [Author.objects.create(first_name='John %s' % i, last_name='Smith') for i in range(5)]
+        cls.genres = [Genre.objects.create(name='Genre %s' % i) for i in range(5)]
+        cls.language = Language.objects.create(name='Ukrainian')
+
+    def test_unbound_form_renders_no_choices(self):
+        with self.assertNumQueries(0):
+            html = BookForm().as_table()
+        self.assertNotIn('John 0', html)
+        self.assertIn('data-autocomplete-url', html)
+
+    def test_bound_form_renders_only_selected(self):
+        form = BookForm(data={'title': 'T', 'summary': 'S', 'isbn': '1', 'author': self.authors[2].pk,
+                              'language': self.language.pk, 'genre': [self.genres[1].pk]})
+        self.assertTrue(form.is_valid())
+        html = form.as_table()
+        self.assertIn('Smith, John 2', html)
+        self.assertNotIn('Smith, John 3', html)
+        self.assertIn('Genre 1', html)
+        self.assertNotIn('Genre 2', html)
+
+    def test_invalid_id_rejected(self):
+        form = BookForm(data={'title': 'T', 'summary': 'S', 'isbn': '1', 'author': 999999,
+                              'genre': [self.genres[0].pk]})
+        self.assertFalse(form.is_valid())
+        self.assertIn('author', form.errors)
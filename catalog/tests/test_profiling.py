@@ -0,0 +1,65 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth.models import User
+from catalog.models import Author, Book, RequestProfile
+import json
+
+
+class ProfilingMiddlewareTest(TestCase):
+
+    def setUp(self):
+        User.objects.create_user(username='staff', password='123', is_staff=True)
+        User.objects.create_user(username='test_user1', password='456')
+        author = Author.objects.create(first_name='John', last_name='Smith')
+        Book.objects.create(title='Book Title', summary='My book summary', isbn='ABCDEFG', author=author)
+
+    def test_not_triggered_without_flag(self):
+        self.client.login(username='staff', password='123')
+        resp = self.client.get(reverse('books'))
+        self.assertNotIn('X-Profile-Id', resp)
+        self.assertFalse(RequestProfile.objects.exists())
+
+    def test_ignored_for_non_staff(self):
+        self.client.login(username='test_user1', password='456')
+        self.client.get(reverse('books') + '?_profile=1')
+        self.assertFalse(RequestProfile.objects.exists())
+
+    def test_staff_request_is_profiled(self):
+        self.client.login(username='staff', password='123')
+        resp = self.client.get(reverse('books') + '?_profile=1')
+        self.assertEqual(resp.status_code, 200)
+        self.assertContains(resp, 'Book Title')
+
+        profile = RequestProfile.objects.get(pk=resp['X-Profile-Id'])
+        self.assertEqual(profile.url_name, 'books')
+        self.assertTrue(profile.query_count >= 1)
+        self.assertEqual(len(json.loads(profile.sql)), profile.query_count)
+        stack, micros = profile.stacks.splitlines()[0].rsplit(' ', 1)
+        self.assertTrue(int(micros) > 0)
+        self.assertTrue(any('render' in line for line in profile.stacks.splitlines()))
+
+    def test_header_trigger(self):
+        self.client.login(username='staff', password='123')
+        resp = self.client.get(reverse('index'), HTTP_X_PROFILE='1')
+        self.assertIn('X-Profile-Id', resp)
+
+
+class ProfileViewsTest(TestCase):
+
+    def setUp(self):
+        User.objects.create_user(username='staff', password='123', is_staff=True)
+        self.profile = RequestProfile.objects.create(url_name='books', path='/catalog/books/', duration=12.5,
+                                                     stacks='a;b 10\n', sql='[]')
+
+    def test_staff_only(self):
+        resp = self.client.get(reverse('profiles'))
+        self.assertEqual(resp.status_code, 302)
+
+    def test_list_and_download(self):
+        self.client.login(username='staff', password='123')
+        resp = self.client.get(reverse('profiles'), {'url_name': 'books'})
+        self.assertEqual(list(resp.context['profiles']), [self.profile])
+
+        resp = self.client.get(reverse('profile-download', args=[self.profile.pk, 'stacks']))
+        self.assertEqual(resp.content, b'a;b 10\n')
+        self.assertIn('attachment', resp['Content-Disposition'])
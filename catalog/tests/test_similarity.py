@@ -0,0 +1,86 @@
+from django.test import TestCase
+from django.core.management import call_command
+from django.urls import reverse
+from catalog.models import Author, Book, Genre, Language, SimilarBook
+from io import StringIO
+from unittest import mock
+import unittest
+
+try:
+    from catalog import similarity
+except ImportError:
+    similarity = None
+
+
+@unittest.skipIf(similarity is None, 'numpy and scipy are required')
+class SimilarBooksTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        tolkien = Author.objects.create(first_name='John', last_name='Tolkien')
+        other = Author.objects.create(first_name='Jane', last_name='Austen')
+        english = Language.objects.create(name='English')
+        fantasy = Genre.objects.create(name='Fantasy')
+        romance = Genre.objects.create(name='Romance')
+
+        def book(title, author, genres):
+            book = Book.objects.create(title=title, summary='Summary', isbn='ABCDEFG', author=author,
+                                       language=english)
+            book.genre.set(genres)
+            return book
+
+        cls.hobbit = book('The Hobbit', tolkien, [fantasy])
+        cls.rings = book('The Lord of the Rings', tolkien, [fantasy])
+        cls.emma = book('Emma', other, [romance])
+        cls.lonely = Book.objects.create(title='No features', summary='Summary', isbn='ABCDEFG')
+
+    def test_rebuild_ranks_same_author_and_genre_first(self):
+        similarity.rebuild(top_k=2, block_size=2)
+        neighbours = list(SimilarBook.objects.filter(book=self.hobbit).values_list('similar', flat=True))
+        self.assertEqual(neighbours, [self.rings.pk, self.emma.pk])
+        self.assertFalse(SimilarBook.objects.filter(book=self.lonely).exists())
+        self.assertFalse(SimilarBook.objects.filter(similar=self.lonely).exists())
+
+    def test_rebuild_replaces_previous_results(self):
+        similarity.rebuild(top_k=2)
+        similarity.rebuild(top_k=1)
+        self.assertEqual(SimilarBook.objects.filter(book=self.hobbit).count(), 1)
+
+    def test_books_created_during_load_are_skipped(self):
+        pairs = similarity.pairs
+
+        def pairs_with_new_book(*args):
+            if not Book.objects.filter(title='Late arrival').exists():
+                late = Book.objects.create(title='Late arrival', summary='Summary', isbn='ABCDEFG',
+                                           author=self.hobbit.author)
+                late.genre.set(self.hobbit.genre.all())
+            return pairs(*args)
+
+        with mock.patch.object(similarity, 'pairs', pairs_with_new_book):
+            book_ids, weighted, binary = similarity.load_features()
+        self.assertEqual(weighted.shape[0], 4)
+        self.assertNotIn(Book.objects.get(title='Late arrival').pk, book_ids)
+
+    def test_books_deleted_during_rebuild_are_skipped(self):
+        iter_top_k = similarity.iter_top_k
+
+        def iter_top_k_after_delete(*args):
+            Book.objects.filter(pk=self.rings.pk).delete()
+            return iter_top_k(*args)
+
+        with mock.patch.object(similarity, 'iter_top_k', iter_top_k_after_delete):
+            similarity.rebuild(top_k=2)
+        neighbours = list(SimilarBook.objects.filter(book=self.hobbit).values_list('similar', flat=True))
+        self.assertEqual(neighbours, [self.emma.pk])
+
+    def test_jaccard_score(self):
+        similarity.rebuild(top_k=1)
+        entry = SimilarBook.objects.get(book=self.hobbit)
+        self.assertAlmostEqual(entry.score, 1.0)
+
+    def test_command_and_detail_view(self):
+        call_command('build_similar_books', top_k=2, stdout=StringIO())
+        with self.assertNumQueries(6):
+            resp = self.client.get(reverse('book-detail', args=[self.hobbit.pk]))
+        self.assertEqual([entry.similar for entry in resp.context['similar_books']], [self.rings, self.emma])
+        self.assertContains(resp, 'The Lord of the Rings')
@@ -0,0 +1,77 @@
+from django.test import TestCase
+from django.core.management import call_command
+from django.urls import reverse
+from catalog import sitemaps
+from catalog.models import Author, Book
+from io import StringIO
+from unittest import mock
+import gzip
+import os
+import re
+import tempfile
+
+
+class SitemapViewTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(first_name='John', last_name='Smith')
+        cls.books = [Book.objects.create(title='Book %s' % number, summary='My book summary', isbn='ABCDEFG',
+                                         author=cls.author) for number in range(3)]
+
+    def content(self, resp):
+        return b''.join(resp.streaming_content).decode()
+
+    def test_index_lists_chunks(self):
+        resp = self.client.get(reverse('sitemap'))
+        self.assertEqual(resp['Content-Type'], 'application/xml')
+        content = self.content(resp)
+        self.assertIn('http://testserver/catalog/sitemap-books-1.xml', content)
+        self.assertIn('http://testserver/catalog/sitemap-authors-1.xml', content)
+
+    def test_section_lists_detail_urls(self):
+        content = self.content(self.client.get(reverse('sitemap-section', args=['books', 1])))
+        for book in self.books:
+            self.assertIn('<loc>http://testserver%s</loc>' % book.get_absolute_url(), content)
+
+    def test_chunks_split_by_primary_key(self):
+        with mock.patch.object(sitemaps, 'SITEMAP_CHUNK_SIZE', 2):
+            first_pk = self.books[0].pk
+            chunks = sitemaps.chunk_numbers('books')
+            self.assertEqual(len(chunks), len({(book.pk - 1) // 2 + 1 for book in self.books}))
+            urls = ''.join(''.join(sitemaps.iter_urlset('', 'books', chunk)) for chunk in chunks)
+        self.assertEqual(urls.count('<url>'), 3)
+        self.assertIn(reverse('book-detail', args=[first_pk]), urls)
+
+    def test_unknown_chunk_is_404(self):
+        for chunk in (99, 99999999999999999999):
+            resp = self.client.get(reverse('sitemap-section', args=['authors', chunk]))
+            self.assertEqual(resp.status_code, 404)
+
+    def test_empty_chunk_below_last_is_404(self):
+        with mock.patch.object(sitemaps, 'SITEMAP_CHUNK_SIZE', 1):
+            Book.objects.filter(pk=self.books[1].pk).delete()
+            self.assertFalse(sitemaps.chunk_exists('books', self.books[1].pk))
+            self.assertTrue(sitemaps.chunk_exists('books', self.books[2].pk))
+
+    def test_build_sitemaps_command(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            call_command('build_sitemaps', base_url='https://example.com', output_dir=output_dir, stdout=StringIO())
+            with gzip.open(os.path.join(output_dir, 'sitemap.xml.gz'), 'rt') as f:
+                self.assertIn('https://example.com/catalog/sitemaps/sitemap-books-1.xml.gz', f.read())
+            with gzip.open(os.path.join(output_dir, 'sitemap-books-1.xml.gz'), 'rt') as f:
+                self.assertEqual(f.read().count('<url>'), 3)
+
+    def test_built_sitemaps_are_served(self):
+        with tempfile.TemporaryDirectory() as output_dir, self.settings(CATALOG_SITEMAP_DIR=output_dir):
+            call_command('build_sitemaps', base_url='https://example.com', stdout=StringIO())
+            with gzip.open(os.path.join(output_dir, 'sitemap.xml.gz'), 'rt') as f:
+                locations = re.findall(r'<loc>https://example\.com([^<]+)</loc>', f.read())
+            self.assertTrue(locations)
+            for path in ['/catalog/sitemaps/sitemap.xml.gz'] + locations:
+                resp = self.client.get(path)
+                self.assertEqual(resp.status_code, 200)
+                self.assertEqual(resp['Content-Type'], 'application/gzip')
+                resp.close()
+            resp = self.client.get(reverse('sitemap-file', args=['sitemap-books-99.xml.gz']))
+            self.assertEqual(resp.status_code, 404)
@@ -0,0 +1,112 @@
+from django.test import TestCase
+from django.core import mail
+from django.core.management import call_command
+from django.contrib.auth.models import User
+from django.utils import timezone
+from django.db import OperationalError
+from catalog import tasks
+from catalog.models import Book, BookInstance, Job
+from unittest import mock
+import datetime
+
+
+@tasks.task
+def failing_task():
+    raise RuntimeError('boom')
+
+
+class JobQueueTest(TestCase):
+
+    def test_enqueue_unknown_task(self):
+        with self.assertRaises(LookupError):
+            tasks.enqueue('no_such_task')
+
+    def test_claim_marks_jobs_running(self):
+        for _ in range(3):
+            tasks.enqueue('send_loan_reminders')
+        claimed = tasks.claim_jobs(2, 'worker-1')
+        self.assertEqual(len(claimed), 2)
+        self.assertTrue(all(job.status == 'r' and job.attempts == 1 for job in claimed))
+        self.assertEqual(len(tasks.claim_jobs(5, 'worker-2')), 1)
+        self.assertEqual(tasks.claim_jobs(5, 'worker-3'), [])
+
+    def test_future_jobs_are_not_claimed(self):
+        tasks.enqueue('send_loan_reminders', run_at=timezone.now() + datetime.timedelta(hours=1))
+        self.assertEqual(tasks.claim_jobs(5), [])
+
+    def test_failed_job_is_retried_with_backoff(self):
+        job = tasks.enqueue('failing_task', max_attempts=2)
+        tasks.run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'q')
+        self.assertIn('boom', job.last_error)
+        self.assertTrue(job.run_at > timezone.now())
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        tasks.run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'f')
+        self.assertEqual(job.attempts, 2)
+
+    def test_stale_jobs_are_released(self):
+        job = tasks.enqueue('send_loan_reminders')
+        tasks.claim_jobs(1)
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - datetime.timedelta(hours=1))
+        self.assertEqual(tasks.release_stale_jobs(), 1)
+
+    def test_stale_jobs_out_of_attempts_fail(self):
+        job = tasks.enqueue('send_loan_reminders', max_attempts=1)
+        tasks.claim_jobs(1)
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - datetime.timedelta(hours=1))
+        self.assertEqual(tasks.release_stale_jobs(), 0)
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'f')
+
+    def test_run_worker_burst(self):
+        job = tasks.enqueue('send_loan_reminders')
+        call_command('run_worker', processes=1, burst=True)
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'd')
+
+    def test_run_worker_survives_database_errors(self):
+        job = tasks.enqueue('send_loan_reminders')
+        run_pending = tasks.run_pending
+        calls = []
+
+        def flaky_run_pending(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                raise OperationalError('database is locked')
+            return run_pending(*args)
+
+        with mock.patch.object(tasks, 'run_pending', flaky_run_pending), \
+                mock.patch('catalog.management.commands.run_worker.time.sleep') as sleep, \
+                self.assertLogs('catalog.management.commands.run_worker', 'ERROR'):
+            call_command('run_worker', processes=1, burst=True)
+        sleep.assert_called_once_with(5)
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'd')
+
+
+class LoanRemindersTest(TestCase):
+
+    def setUp(self):
+        borrower = User.objects.create_user(username='test_user1', password='123', email='reader@example.com')
+        no_email = User.objects.create_user(username='test_user2', password='456')
+        book = Book.objects.create(title='Book Title', summary='My book summary', isbn='ABCDEFG')
+
+        today = datetime.date.today()
+        for days, user in ((-2, borrower), (1, borrower), (10, borrower), (1, no_email)):
+            BookInstance.objects.create(book=book, imprint='Unlikely Imprint, 2016', status='o',
+                                        due_back=today + datetime.timedelta(days=days), borrower=user)
+        BookInstance.objects.create(book=book, imprint='Unlikely Imprint, 2016', status='a',
+                                    due_back=today, borrower=borrower)
+
+    def test_reminders_sent_for_loans_due_soon(self):
+        self.assertEqual(tasks.send_loan_reminders(days=3), 2)
+        self.assertEqual([message.subject for message in mail.outbox],
+                         ['Overdue: Book Title', 'Due soon: Book Title'])
+        self.assertEqual(mail.outbox[0].to, ['reader@example.com'])
+
+    def test_reminders_batched(self):
+        self.assertEqual(tasks.send_loan_reminders(days=3, batch_size=1), 2)
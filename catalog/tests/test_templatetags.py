@@ -0,0 +1,41 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth.models import User, Permission
+from catalog.utils import pk_url
+import uuid
+
+
+class PkUrlTest(TestCase):
+
+    def test_matches_reverse(self):
+        self.assertEqual(pk_url('book-detail', 42), reverse('book-detail', args=[42]))
+        self.assertEqual(pk_url('author_update', 7), reverse('author_update', args=[7]))
+
+    def test_uuid_argument(self):
+        pk = uuid.uuid4()
+        self.assertEqual(pk_url('renew-book', pk), reverse('renew-book', args=[pk]))
+
+
+class SidebarTest(TestCase):
+
+    def setUp(self):
+        User.objects.create_user(username='test_user1', password='123')
+        test_user2 = User.objects.create_user(username='test_user2', password='456')
+        test_user2.user_permissions.add(Permission.objects.get(name='Set book as returned'))
+
+    def test_anonymous(self):
+        resp = self.client.get(reverse('index'))
+        self.assertContains(resp, reverse('login'))
+        self.assertNotContains(resp, reverse('my-borrowed'))
+
+    def test_member_and_librarian_get_own_fragments(self):
+        self.client.login(username='test_user1', password='123')
+        resp = self.client.get(reverse('index'))
+        self.assertContains(resp, 'User: test_user1')
+        self.assertContains(resp, reverse('my-borrowed'))
+        self.assertNotContains(resp, reverse('all-borrowed'))
+
+        self.client.login(username='test_user2', password='456')
+        resp = self.client.get(reverse('index'))
+        self.assertContains(resp, 'User: test_user2')
+        self.assertContains(resp, reverse('all-borrowed'))
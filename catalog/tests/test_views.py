@@ -4,6 +4,7 @@ from django.urls import reverse
 from django.contrib.auth.models import User, Permission
 from django.utils import timezone
 import datetime
+import warnings
 
 
 class AuthorListViewTest(TestCase):
@@ -41,6 +42,66 @@ class AuthorListViewTest(TestCase):
         self.assertTrue(resp.context['is_paginated'] is True)
         self.assertTrue(len(resp.context['author_list']) == 3)
 
+    def test_letter_index_counts(self):
+        Author.objects.create(first_name='Jane', last_name='Austen')
+        resp = self.client.get(reverse('authors'))
+        self.assertEqual(list(resp.context['letters']), [{'letter': 'A', 'count': 1}, {'letter': 'S', 'count': 13}])
+
+    def test_filter_by_letter(self):
+        Author.objects.create(first_name='Jane', last_name='Austen')
+        resp = self.client.get(reverse('authors') + '?letter=A')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([str(author) for author in resp.context['author_list']], ['Austen, Jane'])
+
+    def test_letter_is_case_insensitive(self):
+        Author.objects.create(first_name='Jane', last_name='Austen')
+        Author.objects.create(first_name='Ada', last_name='adams')
+        resp = self.client.get(reverse('authors') + '?letter=a')
+        self.assertEqual(resp.context['letter'], 'A')
+        self.assertEqual({str(author) for author in resp.context['author_list']}, {'adams, Ada', 'Austen, Jane'})
+        self.assertEqual(list(resp.context['letters'])[0], {'letter': 'A', 'count': 2})
+
+    def test_invalid_letter_is_ignored(self):
+        for letter in ('\U0010ffff', '1', 'ab'):
+            resp = self.client.get(reverse('authors'), {'letter': letter})
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(resp.context['letter'], '')
+            self.assertEqual(resp.context['paginator'].count, 13)
+
+
+class AuthorDetailViewTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(first_name='John', last_name='Smith')
+        for number in range(5):
+            book = Book.objects.create(title='Book %s' % number, summary='My book summary', isbn='ABCDEFG',
+                                       author=cls.author)
+            BookInstance.objects.create(book=book, imprint='Unlikely Imprint, 2016', status='a')
+            BookInstance.objects.create(book=book, imprint='Unlikely Imprint, 2016', status='o')
+
+    def test_copy_counts_annotated(self):
+        resp = self.client.get(reverse('author-detail', args=[self.author.pk]))
+        self.assertEqual(resp.status_code, 200)
+        book = resp.context['books'][0]
+        self.assertEqual((book.num_copies, book.num_available), (2, 1))
+        self.assertContains(resp, '1 of 2 available')
+
+    def test_query_count_independent_of_books(self):
+        with self.assertNumQueries(2):
+            self.client.get(reverse('author-detail', args=[self.author.pk]))
+
+
+class BookListViewTest(TestCase):
+
+    def test_books_ordered_by_title(self):
+        for title in ('Zebra', 'Apple', 'Mango'):
+            Book.objects.create(title=title, summary='My book summary', isbn='ABCDEFG')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            resp = self.client.get(reverse('books'))
+        self.assertEqual([book.title for book in resp.context['book_list']], ['Apple', 'Mango', 'Zebra'])
+
 
 class LoanedListViewTest(TestCase):
 
@@ -109,6 +170,14 @@ class LoanedListViewTest(TestCase):
             self.assertEqual(resp.context['user'], book.borrower)
             self.assertEqual('o', book.status)
 
+    def test_copy_without_book_is_not_linked(self):
+        copy = BookInstance.objects.filter(borrower__username='test_user1').first()
+        BookInstance.objects.filter(pk=copy.pk).update(status='o', book=None)
+        self.client.login(username='test_user1', password='123')
+        resp = self.client.get(reverse('my-borrowed'))
+        self.assertContains(resp, '(deleted book)')
+        self.assertNotContains(resp, '/book/None')
+
     def test_pages_ordered_by_due_date(self):
         for copy in BookInstance.objects.all():
             copy.status = 'o'
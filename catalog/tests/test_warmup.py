@@ -0,0 +1,20 @@
+from django.db import OperationalError
+from django.test import TestCase
+from locallibrary import warmup
+from locallibrary.wsgi import application
+from unittest import mock
+
+
+class WarmUpTest(TestCase):
+
+    def test_warm_up_runs_every_step(self):
+        warmed = warmup.warm_up(application)
+        self.assertEqual(set(warmed), {'urls', 'templates', 'databases', 'request'})
+        self.assertEqual(warmed['request'], '200 OK')
+
+    def test_failing_step_is_logged_and_skipped(self):
+        with mock.patch.object(warmup, 'warm_database', side_effect=OperationalError('server closed')), \
+                self.assertLogs('locallibrary.warmup', 'ERROR'):
+            warmed = warmup.warm_up(application)
+        self.assertIsNone(warmed['databases'])
+        self.assertEqual(warmed['request'], '200 OK')
@@ -1,5 +1,5 @@
 from django.conf.urls import url
-from . import views
+from . import api, views
 
 
 urlpatterns = [
@@ -17,4 +17,17 @@ urlpatterns = [
     url(r'^book/create/$', views.BookCreate.as_view(), name='book_create'),
     url(r'^book/(?P<pk>\d+)/update/$', views.BookUpdate.as_view(), name='book_update'),
     url(r'^book/(?P<pk>\d+)/delete/$', views.BookDelete.as_view(), name='book_delete'),
+    url(r'^api/v1/books/$', api.BookApiView.as_view(), name='api-books'),
+    url(r'^api/v1/authors/$', api.AuthorApiView.as_view(), name='api-authors'),
+    url(r'^api/v1/copies/$', api.BookInstanceApiView.as_view(), name='api-copies'),
+    url(r'^api/v1/mybooks/$', api.LoanedApiView.as_view(), name='api-my-borrowed'),
+    url(r'^sitemap\.xml$', views.sitemap_index, name='sitemap'),
+    url(r'^sitemap-(?P<section>books|authors)-(?P<chunk>\d+)\.xml$', views.sitemap_section, name='sitemap-section'),
+    url(r'^sitemaps/(?P<filename>sitemap(?:-(?:books|authors)-\d+)?\.xml\.gz)$', views.sitemap_file,
+        name='sitemap-file'),
+    url(r'^profiles/$', views.profile_list, name='profiles'),
+    url(r'^profiles/(?P<pk>\d+)/(?P<kind>stacks|sql)/$', views.profile_download, name='profile-download'),
+    url(r'^autocomplete/author/$', api.AuthorAutocompleteView.as_view(), name='autocomplete-author'),
+    url(r'^autocomplete/genre/$', api.GenreAutocompleteView.as_view(), name='autocomplete-genre'),
+    url(r'^autocomplete/language/$', api.LanguageAutocompleteView.as_view(), name='autocomplete-language'),
 ]
@@ -0,0 +1,33 @@
+import functools
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import get_script_prefix, get_urlconf, reverse
+
+
+# Digits only, so the placeholder matches both ``\d+`` and ``[-\w]+`` groups.
+URL_PLACEHOLDER = '8675309'
+
+
+@functools.lru_cache(maxsize=None)
+def url_template(name, script_prefix, urlconf):
+    url = reverse(name, args=[URL_PLACEHOLDER], urlconf=urlconf)
+    head, placeholder, tail = url.rpartition(URL_PLACEHOLDER)
+    return head, tail
+
+
+def pk_url(name, pk):
+    """
+    Equivalent of ``reverse(name, args=[pk])`` for single-argument patterns.
+
+    The pattern is reversed once per process; each call is then a string
+    concatenation, which keeps per-row URLs cheap on long list pages.
+    """
+    head, tail = url_template(name, get_script_prefix(), get_urlconf())
+    return '{0}{1}{2}'.format(head, pk, tail)
+
+
+@receiver(setting_changed)
+def clear_url_templates(*, setting, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        url_template.cache_clear()
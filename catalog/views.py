@@ -1,14 +1,19 @@
 from django.shortcuts import render
-from .models import Book, Author, BookInstance, Genre
+from .models import Book, Author, BookInstance, Genre, RequestProfile, SimilarBook
+from . import deletion, sitemaps, tasks
 from django.views import generic
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.shortcuts import get_object_or_404
-from .forms import RenewBookForm
+from .forms import BookForm, RenewBookForm
 import datetime
-from django.http import HttpResponseRedirect
+import os
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.contrib.admin.views.decorators import staff_member_required
 from django.urls import reverse, reverse_lazy
 from django.contrib.auth.decorators import permission_required
 from django.views.generic.edit import CreateView, UpdateView, DeleteView
+from django.db.models import Count, Q
+from django.db.models.functions import Substr, Upper
 
 
 def index(request):
@@ -36,20 +41,62 @@ class BookListView(generic.ListView):
     model = Book
     paginate_by = 10
 
+    def get_queryset(self):
+        return Book.objects.select_related('author').order_by('title', 'pk')
+
 
 class BookDetailView(generic.DetailView):
     model = Book
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['similar_books'] = (SimilarBook.objects.filter(book=self.object)
+                                    .select_related('similar').order_by('rank'))
+        # Archived copies live outside the hot table and are only read when asked for.
+        context['show_archived'] = self.request.GET.get('archived') == '1'
+        if context['show_archived']:
+            context['archived_copies'] = self.object.archived_copies.all()
+        return context
+
 
 class AuthorListView(generic.ListView):
     model = Author
     paginate_by = 10
-    ordering = ['last_name']
+    ordering = ['last_name', 'first_name']
+
+    def get_letter(self):
+        # Only a single letter is a valid index entry; anything else shows every author.
+        letter = self.request.GET.get('letter', '').upper()
+        return letter if len(letter) == 1 and letter.isalpha() else ''
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        letter = self.get_letter()
+        if letter:
+            # Matches the Upper(Substr()) grouping below on every collation, and
+            # uses the UPPER/NOCASE prefix index from migration 0009.
+            queryset = queryset.filter(last_name__istartswith=letter)
+        return queryset
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['letter'] = self.get_letter()
+        context['letters'] = (Author.objects.annotate(letter=Upper(Substr('last_name', 1, 1)))
+                              .values('letter').annotate(count=Count('pk')).order_by('letter'))
+        return context
 
 
 class AuthorDetailView(generic.DetailView):
     model = Author
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['books'] = (self.object.book_set
+                            .annotate(num_copies=Count('bookinstance'),
+                                      num_available=Count('bookinstance', filter=Q(bookinstance__status__exact='a')))
+                            .order_by('title'))
+        return context
+
 
 class LoanedListView(LoginRequiredMixin, generic.ListView):
     model = BookInstance
@@ -57,7 +104,8 @@ class LoanedListView(LoginRequiredMixin, generic.ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        return BookInstance.objects.filter(borrower=self.request.user).filter(status__exact='o').order_by('due_back')
+        return (BookInstance.objects.filter(borrower=self.request.user).filter(status__exact='o')
+                .select_related('book').order_by('due_back'))
 
 
 class AllLoanedListView(PermissionRequiredMixin, generic.ListView):
@@ -67,7 +115,7 @@ class AllLoanedListView(PermissionRequiredMixin, generic.ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        return BookInstance.objects.filter(status__exact='o').order_by('due_back')
+        return BookInstance.objects.filter(status__exact='o').select_related('book', 'borrower').order_by('due_back')
 
 
 @permission_required('catalog.can_mark_returned')
@@ -102,25 +150,115 @@ class AuthorUpdate(PermissionRequiredMixin, UpdateView):
     permission_required = 'catalog.can_mark_returned'
 
 
-class AuthorDelete(PermissionRequiredMixin, DeleteView):
+class BatchedDeleteMixin:
+    """
+    Delete through :mod:`catalog.deletion` instead of Django's collector.
+
+    Objects with more than ``CATALOG_INLINE_DELETE_LIMIT`` rows of
+    ``dependent_model`` pointing at them through ``dependent_field`` are handed
+    to the background worker as ``delete_task`` rather than deleted in the
+    request by ``delete_function``.
+    """
+    dependent_model = None
+    dependent_field = None
+    delete_function = None
+    delete_task = None
+
+    def count_dependents(self):
+        return self.dependent_model._default_manager.filter(**{self.dependent_field: self.object}).count()
+
+    def delete(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        if self.count_dependents() > deletion.inline_delete_limit():
+            tasks.enqueue(self.delete_task, pk=self.object.pk)
+            return render(request, 'catalog/delete_scheduled.html', {'object': self.object})
+
+        self.delete_function(self.object.pk)
+        return HttpResponseRedirect(self.get_success_url())
+
+
+class AuthorDelete(PermissionRequiredMixin, BatchedDeleteMixin, DeleteView):
     model = Author
     success_url = reverse_lazy('authors')
     permission_required = 'catalog.can_mark_returned'
+    dependent_model = Book
+    dependent_field = 'author'
+    delete_function = staticmethod(deletion.delete_author)
+    delete_task = 'delete_author'
 
 
 class BookCreate(PermissionRequiredMixin, CreateView):
     model = Book
-    fields = '__all__'
+    form_class = BookForm
     permission_required = 'catalog.can_mark_returned'
 
 
 class BookUpdate(PermissionRequiredMixin, UpdateView):
     model = Book
-    fields = '__all__'
+    form_class = BookForm
     permission_required = 'catalog.can_mark_returned'
 
 
-class BookDelete(PermissionRequiredMixin, DeleteView):
+class BookDelete(PermissionRequiredMixin, BatchedDeleteMixin, DeleteView):
     model = Book
     success_url = reverse_lazy('books')
     permission_required = 'catalog.can_mark_returned'
+    dependent_model = BookInstance
+    dependent_field = 'book'
+    delete_function = staticmethod(deletion.delete_book)
+    delete_task = 'delete_book'
+
+
+def site_root(request):
+    return request.build_absolute_uri('/').rstrip('/')
+
+
+def sitemap_index(request):
+    root = site_root(request)
+
+    def location(section, chunk):
+        return root + reverse('sitemap-section', kwargs={'section': section, 'chunk': chunk})
+
+    return StreamingHttpResponse(sitemaps.iter_index(location), content_type='application/xml')
+
+
+def sitemap_section(request, section, chunk):
+    chunk = int(chunk)
+    if section not in sitemaps.SECTIONS or not sitemaps.chunk_exists(section, chunk):
+        raise Http404
+    return StreamingHttpResponse(sitemaps.iter_urlset(site_root(request), section, chunk),
+                                 content_type='application/xml')
+
+
+def sitemap_file(request, filename):
+    """Serve a file written by ``manage.py build_sitemaps``; the URL pattern only admits its names."""
+    try:
+        return FileResponse(open(os.path.join(sitemaps.sitemap_dir(), filename), 'rb'),
+                            content_type='application/gzip')
+    except FileNotFoundError:
+        raise Http404
+
+
+@staff_member_required
+def profile_list(request):
+    profiles = RequestProfile.objects.select_related('user').defer('stacks', 'sql')
+    url_name = request.GET.get('url_name')
+    if url_name:
+        profiles = profiles.filter(url_name=url_name)
+    url_names = RequestProfile.objects.order_by('url_name').values_list('url_name', flat=True).distinct()
+    return render(request, 'catalog/requestprofile_list.html', {'profiles': profiles[:100],
+                                                                 'url_names': url_names,
+                                                                 'url_name': url_name})
+
+
+@staff_member_required
+def profile_download(request, pk, kind):
+    profile = get_object_or_404(RequestProfile, pk=pk)
+    if kind == 'sql':
+        response = HttpResponse(profile.sql, content_type='application/json')
+        filename = 'profile-{0}-sql.json'.format(profile.pk)
+    else:
+        response = HttpResponse(profile.stacks, content_type='text/plain; charset=utf-8')
+        filename = 'profile-{0}.folded'.format(profile.pk)
+    response['Content-Disposition'] = 'attachment; filename="{0}"'.format(filename)
+    return response
@@ -0,0 +1,35 @@
+import multiprocessing
+import os
+
+
+bind = '0.0.0.0:{0}'.format(os.environ.get('PORT', '8000'))
+
+# Heroku sets WEB_CONCURRENCY per dyno size; cpu_count() there reports the host.
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# Each thread may hold its own persistent database connection (conn_max_age), so keep this small.
+threads = int(os.environ.get('GUNICORN_THREADS', 2))
+
+# Import Django once in the master so workers fork with the app already loaded.
+preload_app = True
+
+# Recycle workers periodically, staggered so they do not all restart together.
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', max_requests // 10))
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+
+def post_fork(server, worker):
+    # An exception here is a worker boot error, which makes the arbiter halt
+    # the whole server, so warm-up failures are only logged.
+    try:
+        from locallibrary.warmup import warm_up
+        from locallibrary.wsgi import application
+
+        warmed = warm_up(application)
+    except Exception:
+        server.log.exception('Worker %s warm-up failed', worker.pid)
+    else:
+        server.log.info('Worker %s warmed up: %s', worker.pid, warmed)
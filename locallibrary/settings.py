@@ -39,7 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'catalog',
+    'catalog.apps.CatalogConfig',
 ]
 
 MIDDLEWARE = [
@@ -51,6 +51,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'catalog.middleware.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'locallibrary.urls'
@@ -129,6 +130,12 @@ LOGIN_REDIRECT_URL = '/catalog'
 
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
+# Authors/books with more dependents than this are deleted by the background worker.
+CATALOG_INLINE_DELETE_LIMIT = 1000
+
+# Where build_sitemaps writes the precompressed sitemaps served at /catalog/sitemaps/.
+CATALOG_SITEMAP_DIR = os.path.join(BASE_DIR, 'sitemaps')
+
 db_from_env = dj_database_url.config(conn_max_age=500)
 DATABASES['default'].update(db_from_env)
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
@@ -0,0 +1,98 @@
+"""
+Warm-up helpers run in every gunicorn worker right after it is forked.
+
+They pay the one-off costs that would otherwise land on the first request a
+worker serves: compiling URL patterns, parsing templates into the cached
+loader and opening the database connection. A failing step is logged and
+skipped: warm-up must never stop a worker from booting.
+"""
+
+import logging
+import os
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.db import connections
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.urls import NoReverseMatch, URLPattern, URLResolver, get_resolver, resolve, reverse
+
+
+logger = logging.getLogger(__name__)
+
+
+def iter_patterns(patterns, namespace=None):
+    for pattern in patterns:
+        # Accessing ``regex`` compiles and caches the pattern.
+        pattern.pattern.regex
+        if isinstance(pattern, URLResolver):
+            yield from iter_patterns(pattern.url_patterns, pattern.namespace or namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield '{0}:{1}'.format(namespace, pattern.name) if namespace else pattern.name
+
+
+def warm_urls():
+    resolver = get_resolver()
+    resolver.reverse_dict
+    count = 0
+    for name in iter_patterns(resolver.url_patterns):
+        try:
+            resolve(reverse(name))
+        except NoReverseMatch:
+            # Patterns with required arguments are still compiled above.
+            pass
+        count += 1
+    return count
+
+
+def warm_templates():
+    count = 0
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        for directory in engine.template_dirs:
+            if not str(directory).startswith(settings.BASE_DIR):
+                continue
+            for root, dirs, files in os.walk(directory):
+                for filename in files:
+                    if filename.endswith('.html'):
+                        engine.get_template(os.path.relpath(os.path.join(root, filename), directory))
+                        count += 1
+    return count
+
+
+def warm_database():
+    for connection in connections.all():
+        connection.ensure_connection()
+    return len(connections.all())
+
+
+def warm_request(application, path):
+    # One internal GET exercises the middleware, ORM and render paths that
+    # are otherwise first hit by a real user.
+    environ = {'PATH_INFO': path, 'HTTP_HOST': (settings.ALLOWED_HOSTS or ['localhost'])[0]}
+    setup_testing_defaults(environ)
+    status = []
+    response = application(environ, lambda code, headers, exc_info=None: status.append(code))
+    try:
+        for chunk in response:
+            pass
+    finally:
+        if hasattr(response, 'close'):
+            response.close()
+    return status[0] if status else None
+
+
+def warm_up(application=None):
+    steps = [('urls', warm_urls), ('templates', warm_templates), ('databases', warm_database)]
+    if application is not None:
+        steps.append(('request', lambda: warm_request(application, reverse('books'))))
+
+    warmed = {}
+    for name, step in steps:
+        try:
+            warmed[name] = step()
+        except Exception:
+            logger.exception('Warm-up step %r failed', name)
+            warmed[name] = None
+    return warmed